@@ -1,24 +1,43 @@
 import yaml
 import os
+
+# Prefer the libyaml-backed dumper; fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 import subprocess
 import sys
-import json
+import threading
+import time
 from typing import Dict, Any, List
 
-def setup_databricks_authentication(workspace_url: str) -> str:
+def setup_databricks_authentication(workspace_url: str) -> Config:
     """
     Sets up Databricks authentication using OAuth with the profile name "mcp_server_for_databricks"
-    and returns the access token for SDK usage.
-    
+    and returns an SDK Config with resolved credentials for client usage.
+    The databricks CLI is only invoked to run the interactive login flow when
+    the profile does not yet hold valid credentials.
+
     Args:
         workspace_url: URL of the Databricks workspace
-        
+
     Returns:
-        The Databricks access token
+        The authenticated Databricks SDK Config
     """
     profile_name = "mcp_server_for_databricks"
-    
+
+    # Reuse the profile if it already holds valid credentials
+    try:
+        config = Config(host=workspace_url, profile=profile_name)
+        config.authenticate()
+        print(f"Using existing credentials for profile '{profile_name}'")
+        return config
+    except Exception:
+        pass
+
     try:
         # Run databricks auth login command with profile name
         process = subprocess.Popen(
@@ -26,34 +45,39 @@ def setup_databricks_authentication(workspace_url: str) -> str:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
-        stdout, stderr = process.communicate()
-        
+
+        # Drain the pipes on a worker thread while the heartbeat runs; if
+        # nothing reads them, a chatty login can fill the OS pipe buffer and
+        # block the CLI before it ever exits
+        captured = {}
+
+        def _drain():
+            captured["stdout"], captured["stderr"] = process.communicate()
+
+        drain_thread = threading.Thread(target=_drain, daemon=True)
+        drain_thread.start()
+
+        # Print a heartbeat while the user completes the browser OAuth flow so
+        # the CLI does not look hung
+        print("Waiting for browser login to complete", end="", flush=True)
+        while process.poll() is None:
+            print(".", end="", flush=True)
+            time.sleep(2)
+        print()
+        drain_thread.join()
+        stdout, stderr = captured["stdout"], captured["stderr"]
+
         if process.returncode != 0:
             print(f"Error during authentication: {stderr.decode()}")
             sys.exit(1)
-            
+
         print(f"Authentication successful with profile '{profile_name}'")
-        
-        # Get the token from CLI using the same profile
-        try:
-            token_output = subprocess.check_output(
-                ["databricks", "auth", "token", "--host", workspace_url, "--profile", profile_name]
-            ).decode("utf-8").strip()
-            
-            # Parse the JSON output
-            token_data = json.loads(token_output)
-            access_token = token_data.get("access_token")
-            
-            if not access_token:
-                print("Failed to extract access_token from token response")
-                sys.exit(1)
-                
-            return access_token
-            
-        except json.JSONDecodeError:
-            print(f"Failed to parse token output as JSON")
-            sys.exit(1)
-            
+
+        # Resolve the freshly created credentials in-process via the SDK
+        config = Config(host=workspace_url, profile=profile_name)
+        config.authenticate()
+        return config
+
     except FileNotFoundError:
         print("Error: databricks-cli not found. Please install it using: pip install databricks-cli")
         sys.exit(1)
@@ -109,7 +133,7 @@ def save_config(config: Dict[str, Any]) -> None:
     """
     try:
         with open("config.yaml", "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False)
         print("\nConfiguration saved to config.yaml")
     except Exception as e:
         print(f"Error saving configuration: {str(e)}")
@@ -126,13 +150,10 @@ def main():
         sys.exit(1)
         
     # Setup authentication
-    access_token = setup_databricks_authentication(workspace_url)
-    
+    sdk_config = setup_databricks_authentication(workspace_url)
+
     # Create client
-    client = WorkspaceClient(
-        host=workspace_url,
-        token=access_token
-    )
+    client = WorkspaceClient(config=sdk_config)
     
     # Get warehouse configuration
     warehouse_config = get_warehouse_config(client)
@@ -1,216 +1,219 @@
 import sys
 import logging
-import subprocess
 from fastapi import HTTPException
 from pydantic import BaseModel
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 from typing import List, Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP
-from logging.handlers import RotatingFileHandler
 from utils import (
     load_config,
     get_schema_list,
     get_table_sample,
-    get_run_result
+    get_run_result,
+    seed_table_metadata_cache
 )
 import asyncio
 import os
-from datetime import datetime, timezone
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
+# Make the src package importable when running main.py directly, so the
+# authentication flow is shared with the packaged server instead of duplicated
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+from mcp_server_for_databricks.auth.databricks_auth import databricks_login
+from mcp_server_for_databricks.utils.logging import setup_logging, get_logger
 
-# Constants
-login_initialization_complete = False
-config = None
-workspace_config = None
-client = None
-logger = None
-token_expiry_datetime = None
 
-def setup_logging(log_dir: str = ".logs", log_filename: str = "mcp_unity.log") -> logging.Logger:
+@dataclass(slots=True)
+class AppState:
     """
-    Set up logging configuration to write to a file and console.
-    Creates the log directory if it doesn't exist.
-    
-    Args:
-        log_dir: Directory to store log files
-        log_filename: Name of the log file
-        
-    Returns:
-        Configured root logger
+    Application state shared by the MCP tool handlers. Kept in a single
+    slotted object so handlers do one attribute lookup instead of resolving
+    several module globals.
     """
-    # Create log directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
-    log_file = os.path.join(log_dir, log_filename)
-    
-    # First clear any existing handlers to avoid duplicates
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    
-    # Create file handler with immediate flush
-    file_handler = RotatingFileHandler(
-        log_file, 
-        maxBytes=10*1024*1024, 
-        backupCount=5,
-        delay=False  
-    )
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    # Configure the root logger
-    root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-    
-    # Log the setup and flush immediately
-    root_logger.info(f"Logging configured to write to {log_file}")
-    for handler in root_logger.handlers:
-        handler.flush()
-    
-    return root_logger
+    config: Optional[Dict[str, Any]] = None
+    workspace_config: Optional[Dict[str, Any]] = None
+    client: Optional[WorkspaceClient] = None
+    logger: Optional[logging.Logger] = None
+    token_expiry_datetime: Optional[datetime] = None
+    # Monotonic deadline (expiry minus safety buffer); checked on every tool
+    # call, so a float compare beats building tz-aware datetimes each time
+    token_expiry_monotonic: Optional[float] = None
+    login_initialization_complete: bool = False
+    # Strong reference to the background connectivity probe; the event loop
+    # only keeps weak references to tasks, so an unreferenced task can be
+    # garbage-collected before it runs
+    connectivity_task: Optional[asyncio.Task] = None
 
-def get_logger(name: str) -> logging.Logger:
+STATE = AppState()
+
+# Resolved once at import time; logging.getLogger takes a module-wide lock on
+# every call, so hot paths reuse this handle instead of looking it up again
+_LOGGER = logging.getLogger(__name__)
+
+class _TokenCache:
     """
-    Get a logger configured to write to the .logs directory.
-    This function ensures all loggers use the same configuration.
-    
-    Args:
-        name: Name for the logger (typically __name__ from the calling module)
-        
-    Returns:
-        Properly configured logger
+    In-process cache of resolved OAuth tokens keyed by (host, profile).
+    Tokens are reused until their expiry is near, so repeated initialization
+    does not re-resolve credentials. The lock makes concurrent callers share
+    a single refresh instead of each triggering their own.
     """
-    # Use the root logger's handlers
-    return logging.getLogger(name)
 
-async def databricks_login(host: str, refresh_token: bool = False) -> bool:
+    # Refresh this long before the reported expiry to avoid using a token
+    # that expires mid-request
+    expiry_buffer = timedelta(seconds=60)
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+
+    @staticmethod
+    def _normalized_expiry(oauth_token) -> Optional[datetime]:
+        expiry = oauth_token.expiry
+        if expiry is not None and expiry.tzinfo is None:
+            expiry = expiry.astimezone()
+        return expiry
+
+    @classmethod
+    def _monotonic_deadline(cls, oauth_token) -> Optional[float]:
+        """Translate the token expiry into a time.monotonic() deadline with the safety buffer applied."""
+        expiry = cls._normalized_expiry(oauth_token)
+        if expiry is None:
+            return None
+        remaining = (expiry - datetime.now(timezone.utc)) - cls.expiry_buffer
+        return time.monotonic() + remaining.total_seconds()
+
+    async def get_token(self, host: str, profile: str) -> tuple:
+        """
+        Return a cached (sdk_config, oauth_token) pair for the given host and
+        profile, refreshing only when the cached token is missing or near expiry.
+        """
+        key = (host, profile)
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expiry = self._normalized_expiry(entry[1])
+                if expiry is not None and datetime.now(timezone.utc) < expiry - self.expiry_buffer:
+                    return entry
+
+            sdk_config = Config(
+                host=host,
+                profile=profile,
+                # Keep a warm connection pool so repeated REST calls reuse
+                # TCP+TLS sessions instead of re-handshaking per request
+                max_connection_pools=20,
+                max_connections_per_pool=20
+            )
+            # Credential resolution can hit the network, run it off the event loop
+            oauth_token = await asyncio.to_thread(sdk_config.oauth_token)
+            self._entries[key] = (sdk_config, oauth_token)
+            return self._entries[key]
+
+_token_cache = _TokenCache()
+
+class _MetadataCache:
     """
-    Perform Databricks login using the CLI with the mcp_server_for_databricks profile.
-    
-    Args:
-        host: Databricks workspace URL
-        
-    Returns:
-        bool: True if login was successful, False otherwise
+    TTL cache for metadata tool results keyed by the tool arguments.
+    Catalog metadata changes infrequently, so repeated calls within the TTL
+    reuse the previous result instead of re-issuing REST or warehouse queries.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+
+    async def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if time.monotonic() - timestamp > self._ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    async def set(self, key: tuple, value: Any) -> None:
+        """Store a value for key, evicting the oldest entry when full."""
+        async with self._lock:
+            if len(self._entries) >= self._maxsize:
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic(), value)
+
+_metadata_cache = _MetadataCache()
+
+async def _validate_connectivity(workspace_client: WorkspaceClient, log: logging.Logger) -> None:
+    """
+    Background connectivity check so startup does not block on the API probe.
+    Uses current_user.me(), a single small REST call, instead of paginating
+    through the catalog listing. Runs in a worker thread and only logs the outcome.
     """
-    login_success = False
-    profile_name = "mcp_server_for_databricks"
-    
     try:
-        # Check if already authenticated
-        logging.info(f"Checking Databricks authentication status for host: {host} using profile: {profile_name}")
-        
-        # Use Popen instead of run to be able to capture output even on timeout
-        process = subprocess.Popen(
-            ["databricks", "auth", "token", "--host", host, "--profile", profile_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        try:
-            stdout, stderr = process.communicate(timeout=15)
-            returncode = process.returncode
-            
-            if returncode == 0:
-                logging.info(f"Already authenticated with Databricks using profile: {profile_name}")
-                return True
-                
-        except subprocess.TimeoutExpired:
-            # Try to get output even after timeout
-            logging.error("Timeout during Databricks auth check")
-            try:
-                process.kill()
-                stdout, stderr = process.communicate()
-                logging.error(f"Auth check timeout - stdout before timeout: {stdout}")
-                logging.error(f"Auth check timeout - stderr before timeout: {stderr}")
-            except Exception as kill_e:
-                logging.error(f"Error killing process after timeout: {str(kill_e)}")
-    
+        me = await asyncio.to_thread(workspace_client.current_user.me)
+        log.info(f"Connectivity check succeeded, authenticated as {me.user_name}")
     except Exception as e:
-        logging.error(f"Error during Databricks auth check: {str(e)} \n Now trying to execute initial login")
-    
-    # If we reach here, either auth check failed, timed out, or errored - try login
-    logging.info(f"Starting Databricks authentication login flow with profile: {profile_name}...")
-    try:
-        process = subprocess.Popen(
-            ["databricks", "auth", "login", "--host", host, "--profile", profile_name],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Wait for the process to complete with a timeout
-        try:
-            stdout, stderr = process.communicate(timeout=30)
-            logging.info(f"Login process stdout: {stdout}")
-            logging.info(f"Login process stderr: {stderr}")
-            
-            if process.returncode != 0:
-                logging.error(f"Databricks login failed with return code: {process.returncode}")
-                logging.error(f"Databricks login stderr: {stderr}")
-                logging.error(f"Databricks login stdout: {stdout}")
-                return False
-            logging.info(f"Successfully logged in to Databricks with profile: {profile_name}")
-            return True
-        except subprocess.TimeoutExpired:
-            # Try to get output even after timeout
-            try:
-                process.kill()
-                stdout, stderr = process.communicate()
-                logging.error(f"Login timeout - stdout before timeout: {stdout}")
-                logging.error(f"Login timeout - stderr before timeout: {stderr}")
-            except Exception as kill_e:
-                logging.error(f"Error killing process after timeout: {str(kill_e)}")
-            logging.error("Databricks login timed out")
-            return False
-    except Exception as login_e:
-        logging.error(f"Exception during login process: {str(login_e)}")
-        return False
-    return login_success
-            
+        log.error(f"Connectivity check failed: {str(e)}")
+
 def check_if_token_expired():
-    global token_expiry_datetime
-    if token_expiry_datetime is None:
-        return True
-    if datetime.now(timezone.utc) > token_expiry_datetime:
+    # The deadline already folds in the safety buffer, so this is a single
+    # float compare on the per-tool-call hot path
+    if STATE.token_expiry_monotonic is None:
         return True
-    return False
+    return time.monotonic() > STATE.token_expiry_monotonic
+
+# Single-flight guard so concurrent tool calls share one initialization or
+# token refresh instead of stampeding
+_init_lock = asyncio.Lock()
 
 async def initialize_globals():
-    global login_initialization_complete
-    global config
-    global workspace_config
-    global client
-    global logger
-    global token_expiry_datetime
-    if login_initialization_complete:
+    state = STATE
+    # Fast path: initialized and token still healthy, no lock needed
+    if state.login_initialization_complete and not check_if_token_expired():
+        state.logger.info("Token is not expired, skipping initialization")
+        return None
+    async with _init_lock:
+        await _initialize_globals_locked(state)
+
+async def _initialize_globals_locked(state: AppState):
+    # Re-check under the lock: another caller may have finished the refresh
+    # while we were waiting
+    if state.login_initialization_complete:
         if check_if_token_expired():
             # If the token is expired, only execute to refresh the token and client
-            logger.info("Token is expired, executing to refresh the token and client")
+            state.logger.info("Token is expired, executing to refresh the token and client")
             partial_execution = True
         else:
-            logger.info("Token is not expired, skipping initialization")
+            state.logger.info("Token is not expired, skipping initialization")
             return None
     else:
         partial_execution = False
-        setup_logging()
+        setup_logging(transport='stdio')
+        # Blocking SDK calls run via asyncio.to_thread; give the loop one
+        # bounded, long-lived executor so bursts reuse warm threads (and the
+        # SDK's pooled connections) instead of growing the default pool
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=8, thread_name_prefix="databricks-io")
+        )
         
-    logger = logging.getLogger(__name__)
+    logger = state.logger = _LOGGER
     if not partial_execution:
         logger.info("Initializing globals...")
     else:
         logger.info("Partial execution initiated to refresh token and client...")
     try:
-        config = await load_config(logger)
-        workspace_config = config["workspace"]
+        # Config does not change between token refreshes; only hit the disk
+        # and re-parse YAML when it has not been loaded yet
+        if state.config is None:
+            state.config = load_config(logger)
+        config = state.config
+        state.workspace_config = config["workspace"]
         
         # Validate Databricks configuration
         if "url" not in config["workspace"]:
@@ -231,59 +234,47 @@ async def initialize_globals():
             
             # Initialize client with default profile
             logger.info("Creating Databricks WorkspaceClient...")
-            
-            # Get the token from CLI and parse the JSON response
+
+            # Resolve credentials in-process via the SDK instead of shelling out to the CLI
             profile_name = "mcp_server_for_databricks"
-            token_output = subprocess.check_output(["databricks", "auth", "token", "--host", databricks_host, "--profile", profile_name]).decode("utf-8").strip()
-            logger.info(f"Successfully retrieved auth token using profile: {profile_name}")
-            
-            try:
-                # Parse the JSON output
-                token_data = json.loads(token_output)
-                access_token = token_data.get("access_token")
-                token_expiry_datetime = datetime.fromisoformat(token_data.get("expiry"))
-                
-                if not access_token:
-                    logger.error("Failed to extract access_token from token response")
-                    logger.error(f"Token response: {token_output}")
-                    raise ValueError("Could not extract access_token from Databricks token response")
-                
-                logger.info("Successfully extracted access_token")
-                
-                # Create client with the extracted token
-                client = WorkspaceClient(
-                    host=databricks_host,
-                    token=access_token
-                )
-                
-                logger.info("WorkspaceClient created successfully with access_token")
-                if partial_execution:
-                    return None
-                
-            except json.JSONDecodeError:
-                logger.error(f"Failed to parse token output as JSON: {token_output}")
-                raise ValueError("Invalid JSON response from databricks auth token command")
-
-                
+            sdk_config, oauth_token = await _token_cache.get_token(databricks_host, profile_name)
+            state.token_expiry_datetime = _TokenCache._normalized_expiry(oauth_token)
+            state.token_expiry_monotonic = _TokenCache._monotonic_deadline(oauth_token)
+            logger.info(f"Successfully resolved credentials using profile: {profile_name}")
+
+            # Create the client backed by the SDK config, whose credentials
+            # strategy refreshes the bearer token internally per request.
+            # Only rebuild when the config object actually changed, so token
+            # refreshes keep the existing client and its keep-alive
+            # connection pool instead of discarding them
+            if state.client is None or state.client.config is not sdk_config:
+                state.client = WorkspaceClient(config=sdk_config)
+                logger.info("WorkspaceClient created successfully")
+            else:
+                logger.info("Reusing existing WorkspaceClient and its connection pool")
+
+            # Validate connectivity in the background so tool calls are not
+            # blocked waiting on the probe to complete; the handle lives on
+            # the app state so the task cannot be collected mid-flight
+            state.connectivity_task = asyncio.create_task(
+                _validate_connectivity(state.client, logger)
+            )
+            if partial_execution:
+                return None
+
         except Exception as e:
-            logger.error(f"Failed to connect to Databricks: {type(e).__name__}: {str(e)}")
-            if hasattr(e, '__traceback__'):
-                import traceback
-                tb_str = ''.join(traceback.format_tb(e.__traceback__))
-                logger.error(f"Traceback: {tb_str}")
+            # logger.exception defers traceback formatting to the handler, so
+            # it is only rendered if the record is actually emitted
+            logger.exception("Failed to connect to Databricks: %s: %s", type(e).__name__, e)
             raise ValueError(
                 f"Failed to connect to Databricks workspace: {str(e)}. "
                 "Please check your authentication and permissions."
             )
             
-        login_initialization_complete = True
+        state.login_initialization_complete = True
         logger.info("Global initialization completed successfully")
     except Exception as e:
-        logger.error(f"Error during initialization: {type(e).__name__}: {str(e)}")
-        if hasattr(e, '__traceback__'):
-            import traceback
-            tb_str = ''.join(traceback.format_tb(e.__traceback__))
-            logger.error(f"Traceback: {tb_str}")
+        logger.exception("Error during initialization: %s: %s", type(e).__name__, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to initialize application: {str(e)}"
@@ -294,52 +285,72 @@ mcp = FastMCP("mcp_unity")
 
 
 @mcp.tool()
-async def get_schemas(catalog: str):
+async def get_schemas(catalog: str, cache_bypass: bool = False):
     """
     Get all schemas and their tables in the workspace for the default catalog.
+    Results are cached for a few minutes; pass cache_bypass=True to force a refresh.
     """
-    global login_initialization_complete, client, workspace_config, logger
-    
+    state = STATE
+
     try:
         await initialize_globals()
-            
-        logger.info("Globals initialized: %s", login_initialization_complete)
+        logger = state.logger
+
+        cache_key = ("schemas", catalog)
+        if not cache_bypass:
+            cached = await _metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached schema list for catalog: %s", catalog)
+                return cached
+
+        logger.info("Globals initialized: %s", state.login_initialization_complete)
         logger.info("Getting schemas...")
         schemas = await get_schema_list(
-            client,
+            state.client,
             catalog=catalog,
             logger=logger
         )
-        
+
+        await _metadata_cache.set(cache_key, schemas)
         return schemas
     
     except Exception as e:
-        logger.error(f"Error getting schemas: {str(e)}")
+        state.logger.error("Error getting schemas: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @mcp.tool()
-async def get_table_sample_tool(catalog: str, schema_name: str, table: str) -> Dict[str, Any]:
+async def get_table_sample_tool(catalog: str, schema_name: str, table: str, cache_bypass: bool = False) -> Dict[str, Any]:
     """
     Return and save detailed table metadata, including integrated sample data, for a given table.
     This function will save the sample data and table metadata to the .input_data folder if configured.
+    Results are cached for a few minutes; pass cache_bypass=True to force a refresh.
     Args:
         catalog: Catalog name
         schema_name: Schema name
         table: Table name
+        cache_bypass: If True, skip the metadata cache and re-query
     Returns:
         Dictionary with detailed table metadata including sample values.
     """
-    global login_initialization_complete, client, workspace_config, logger
+    state = STATE
     try:
         await initialize_globals()
-            
-        logger.info(f"Getting table metadata and sample data for {catalog}.{schema_name}.{table}")
+        logger = state.logger
+
+        cache_key = ("table_sample", catalog, schema_name, table)
+        if not cache_bypass:
+            cached = await _metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached table metadata for %s.%s.%s", catalog, schema_name, table)
+                return cached
+
+        logger.info("Getting table metadata and sample data for %s.%s.%s", catalog, schema_name, table)
 
         # Call get_table_sample which now returns only metadata with integrated sample values
         table_metadata = await get_table_sample(
-            client=client, # Use the global client
-            warehouse_id=workspace_config["warehouse_id"],
+            client=state.client,
+            warehouse_id=state.workspace_config["warehouse_id"],
             catalog=catalog,
             schema=schema_name,
             table=table,
@@ -347,13 +358,14 @@ async def get_table_sample_tool(catalog: str, schema_name: str, table: str) -> D
         )
 
         # Return the comprehensive metadata dictionary
+        await _metadata_cache.set(cache_key, table_metadata)
         return table_metadata
     except Exception as e:
-        logger.error(f"Error getting table sample: {str(e)}")
+        state.logger.error("Error getting table sample: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @mcp.tool()
-async def get_schema_metadata(catalog_name:str, schema_name:str):
+async def get_schema_metadata(catalog_name:str, schema_name:str, cache_bypass: bool = False):
     """
     This function will return the schema metadata for a given schema.
     Args:
@@ -374,25 +386,48 @@ async def get_schema_metadata(catalog_name:str, schema_name:str):
         }
     """
   
-    global login_initialization_complete, client, workspace_config, logger
-    
+    state = STATE
+
     try:
         await initialize_globals()
-        # Get the comment for the schema if it exists
-        schema_comment = client.schemas.get(f"{catalog_name}.{schema_name}").comment
-        tables = client.tables.list(catalog_name, schema_name)
-        schema_metadata = {}
-        schema_metadata['schema_comment'] = schema_comment
-        schema_metadata['tables'] = {}
-        for table in tables:
-            schema_metadata['tables'][table.name] = {
-                'comment' : table.comment,
-                'created_at': table.created_at,
-                'table_type': table.table_type,
-                'owner': table.owner}
+        logger = state.logger
+
+        cache_key = ("schema_metadata", catalog_name, schema_name)
+        if not cache_bypass:
+            cached = await _metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached schema metadata for %s.%s", catalog_name, schema_name)
+                return cached
+
+        # Fetch the schema info and the table listing concurrently, keeping the
+        # blocking SDK calls off the event loop
+        client = state.client
+        schema_info, tables = await asyncio.gather(
+            asyncio.to_thread(client.schemas.get, f"{catalog_name}.{schema_name}"),
+            asyncio.to_thread(lambda: list(client.tables.list(
+                catalog_name, schema_name, include_delta_metadata=True
+            )))
+        )
+        # The listing already carries full TableInfo for every table in the
+        # schema; seed the per-table metadata cache so follow-up sample calls
+        # skip their individual tables.get round trips
+        seed_table_metadata_cache(tables)
+        schema_metadata = {
+            'schema_comment': schema_info.comment,
+            'tables': {
+                table.name: {
+                    'comment': table.comment,
+                    'created_at': table.created_at,
+                    'table_type': table.table_type,
+                    'owner': table.owner
+                }
+                for table in tables
+            }
+        }
+        await _metadata_cache.set(cache_key, schema_metadata)
         return schema_metadata
     except Exception as e:
-        logger.error(f"Error getting table sample: {str(e)}")
+        state.logger.error("Error getting table sample: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     
 @mcp.tool()
@@ -408,29 +443,30 @@ async def get_job_run_result(job_name: str, filter_for_failed_runs: bool = False
     Returns:
         A string containing the error message, error traceback, and metadata for the selected run.
     """
-    global login_initialization_complete, client, logger
+    state = STATE
 
     try:
         await initialize_globals()
+        logger = state.logger
 
-        logger.info(f"Getting run result for job '{job_name}', filter_for_failed_runs={filter_for_failed_runs}")
+        logger.info("Getting run result for job '%s', filter_for_failed_runs=%s", job_name, filter_for_failed_runs)
 
         # Call the utility function from utils.py
         run_result_output = await get_run_result(
             job_name=job_name,
-            client=client,
+            client=state.client,
             logger=logger,
             filter_for_failed_runs=filter_for_failed_runs
         )
 
-        logger.info(f"Successfully retrieved run result for job '{job_name}'")
+        logger.info("Successfully retrieved run result for job '%s'", job_name)
         return run_result_output
 
     except ValueError as ve:
-        logger.error(f"Value error getting run result for job '{job_name}': {str(ve)}")
+        state.logger.error("Value error getting run result for job '%s': %s", job_name, ve)
         raise HTTPException(status_code=404, detail=str(ve)) # 404 if job/run not found
     except Exception as e:
-        logger.error(f"Error getting run result for job '{job_name}': {type(e).__name__}: {str(e)}")
+        state.logger.error("Error getting run result for job '%s': %s: %s", job_name, type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Failed to get run result: {str(e)}")
 
 if __name__ == "__main__":
@@ -1,10 +1,13 @@
 """Main application setup and orchestration."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server.fastmcp import FastMCP
 
 from mcp_server_for_databricks.utils.logging import setup_logging, get_logger
 from mcp_server_for_databricks.config.loader import load_config
+from mcp_server_for_databricks.config.models import AppConfig
 from mcp_server_for_databricks.client.manager import ClientManager
 from mcp_server_for_databricks.mcp_tools.registry import create_mcp_server
 
@@ -23,10 +26,18 @@ class MCPDatabricksApp:
         setup_logging()
         self.logger = get_logger(__name__)
         self.logger.info("Starting MCP Databricks server initialization...")
+
+        # Blocking SDK calls run via asyncio.to_thread; give the loop one
+        # bounded, long-lived executor so bursts reuse warm threads (and the
+        # SDK's pooled connections) instead of growing the default pool
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=8, thread_name_prefix="databricks-io")
+        )
         
         try:
-            # Load configuration
-            self.config = await load_config(self.logger)
+            # Load configuration and bind it to the typed model once, so
+            # downstream access is attribute loads instead of dict lookups
+            self.config = AppConfig.model_validate(load_config(self.logger))
             self.logger.info("Configuration loaded successfully")
             
             # Initialize client manager
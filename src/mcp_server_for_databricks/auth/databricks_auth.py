@@ -1,75 +1,64 @@
 """Databricks authentication utilities."""
 
 import logging
-import subprocess
-import json
+import asyncio
 from datetime import datetime
 
-async def databricks_login(host: str, refresh_token: bool = False) -> bool:
+from databricks.sdk.core import Config
+
+async def databricks_login(host: str, refresh_token: bool = False, token_manager=None) -> bool:
     """
-    Perform Databricks login using the CLI with the mcp_server_for_databricks profile.
-    
+    Authenticate with Databricks using the mcp_server_for_databricks profile.
+    Credentials are resolved in-process through the SDK's unified auth, which
+    reads ~/.databrickscfg directly. The databricks CLI is only invoked as a
+    fallback to run the interactive OAuth login flow on first-time setup.
+
     Args:
         host: Databricks workspace URL
         refresh_token: Whether this is a token refresh operation
-        
+        token_manager: Optional TokenManager; when it already holds a fresh
+            token, the authentication probe is skipped entirely
+
     Returns:
         bool: True if login was successful, False otherwise
     """
     login_success = False
     profile_name = "mcp_server_for_databricks"
-    
+
+    # Steady-state fast path: a valid in-memory token means we are already
+    # authenticated, so skip the credential probe (which can hit the network)
+    if token_manager is not None and token_manager.access_token and not token_manager.is_token_expired():
+        logging.info("Reusing valid in-memory token; skipping authentication probe")
+        return True
+
     try:
-        # Check if already authenticated
+        # Check if already authenticated by resolving credentials in-process
         logging.info(f"Checking Databricks authentication status for host: {host} using profile: {profile_name}")
-        
-        # Use Popen instead of run to be able to capture output even on timeout
-        process = subprocess.Popen(
-            ["databricks", "auth", "token", "--host", host, "--profile", profile_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        try:
-            stdout, stderr = process.communicate(timeout=15)
-            returncode = process.returncode
-            
-            if returncode == 0:
-                logging.info(f"Already authenticated with Databricks using profile: {profile_name}")
-                return True
-                
-        except subprocess.TimeoutExpired:
-            # Try to get output even after timeout
-            logging.error("Timeout during Databricks auth check")
-            try:
-                process.kill()
-                stdout, stderr = process.communicate()
-                logging.error(f"Auth check timeout - stdout before timeout: {stdout}")
-                logging.error(f"Auth check timeout - stderr before timeout: {stderr}")
-            except Exception as kill_e:
-                logging.error(f"Error killing process after timeout: {str(kill_e)}")
-    
+        sdk_config = Config(host=host, profile=profile_name)
+        # authenticate() can hit the network, run it off the event loop
+        await asyncio.to_thread(sdk_config.authenticate)
+        logging.info(f"Already authenticated with Databricks using profile: {profile_name}")
+        return True
     except Exception as e:
         logging.error(f"Error during Databricks auth check: {str(e)} \n Now trying to execute initial login")
-    
-    # If we reach here, either auth check failed, timed out, or errored - try login
+
+    # If we reach here, the profile is missing or its credentials are invalid - try login
     logging.info(f"Starting Databricks authentication login flow with profile: {profile_name}...")
     try:
-        process = subprocess.Popen(
-            ["databricks", "auth", "login", "--host", host, "--profile", profile_name],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+        process = await asyncio.create_subprocess_exec(
+            "databricks", "auth", "login", "--host", host, "--profile", profile_name,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
-        
-        # Wait for the process to complete with a timeout
+
+        # Wait for the process to complete without blocking the event loop
         try:
-            stdout, stderr = process.communicate(timeout=30)
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+            stdout, stderr = stdout.decode(), stderr.decode()
             logging.info(f"Login process stdout: {stdout}")
             logging.info(f"Login process stderr: {stderr}")
-            
+
             if process.returncode != 0:
                 logging.error(f"Databricks login failed with return code: {process.returncode}")
                 logging.error(f"Databricks login stderr: {stderr}")
@@ -77,13 +66,16 @@ async def databricks_login(host: str, refresh_token: bool = False) -> bool:
                 return False
             logging.info(f"Successfully logged in to Databricks with profile: {profile_name}")
             return True
-        except subprocess.TimeoutExpired:
-            # Try to get output even after timeout
+        except asyncio.TimeoutError:
+            # Kill the process so it does not linger after the timeout. Bound
+            # the reap as well: a child stuck in uninterruptible sleep would
+            # otherwise block the event loop indefinitely, so abandon it after
+            # a short grace period and let the OS clean it up.
             try:
                 process.kill()
-                stdout, stderr = process.communicate()
-                logging.error(f"Login timeout - stdout before timeout: {stdout}")
-                logging.error(f"Login timeout - stderr before timeout: {stderr}")
+                await asyncio.wait_for(process.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                logging.error("Login process did not exit after kill; abandoning it")
             except Exception as kill_e:
                 logging.error(f"Error killing process after timeout: {str(kill_e)}")
             logging.error("Databricks login timed out")
@@ -93,7 +85,7 @@ async def databricks_login(host: str, refresh_token: bool = False) -> bool:
         return False
     return login_success
 
-def get_databricks_token(host: str) -> tuple[str, datetime]:
+async def get_databricks_token(host: str) -> tuple[str, datetime]:
     """
     Get the Databricks access token and expiry time.
     
@@ -107,29 +99,26 @@ def get_databricks_token(host: str) -> tuple[str, datetime]:
         ValueError: If token cannot be retrieved or parsed
     """
     profile_name = "mcp_server_for_databricks"
-    
+
     try:
-        token_output = subprocess.check_output(
-            ["databricks", "auth", "token", "--host", host, "--profile", profile_name]
-        ).decode("utf-8").strip()
-        logging.info(f"Successfully retrieved auth token using profile: {profile_name}")
-        
-        # Parse the JSON output
-        token_data = json.loads(token_output)
-        access_token = token_data.get("access_token")
-        token_expiry_datetime = datetime.fromisoformat(token_data.get("expiry"))
-        
+        # Resolve credentials in-process via the SDK instead of shelling out to
+        # the CLI; run it in a worker thread since it can hit the network
+        sdk_config = Config(host=host, profile=profile_name)
+        oauth_token = await asyncio.to_thread(sdk_config.oauth_token)
+        access_token = oauth_token.access_token
+        token_expiry_datetime = oauth_token.expiry
+        if token_expiry_datetime is not None and token_expiry_datetime.tzinfo is None:
+            token_expiry_datetime = token_expiry_datetime.astimezone()
+
         if not access_token:
             logging.error("Failed to extract access_token from token response")
-            logging.error(f"Token response: {token_output}")
             raise ValueError("Could not extract access_token from Databricks token response")
-        
-        logging.info("Successfully extracted access_token")
+
+        logging.info(f"Successfully resolved credentials using profile: {profile_name}")
         return access_token, token_expiry_datetime
-        
-    except json.JSONDecodeError:
-        logging.error(f"Failed to parse token output as JSON: {token_output}")
-        raise ValueError("Invalid JSON response from databricks auth token command")
-    except subprocess.CalledProcessError as e:
+
+    except ValueError:
+        raise
+    except Exception as e:
         logging.error(f"Failed to get token: {e}")
         raise ValueError(f"Failed to retrieve Databricks token: {e}") 
\ No newline at end of file
@@ -1,31 +1,39 @@
 """Token management for Databricks authentication."""
 
 import logging
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from mcp_server_for_databricks.auth.databricks_auth import get_databricks_token
 
 class TokenManager:
     """Manages Databricks authentication tokens and their expiry."""
-    
+
+    # Treat tokens within this window of expiry as already expired, so a
+    # token cannot go stale between the check and the API call it guards
+    EXPIRY_BUFFER = timedelta(seconds=60)
+
     def __init__(self):
         self.access_token: Optional[str] = None
         self.token_expiry_datetime: Optional[datetime] = None
+        # time.monotonic() deadline with EXPIRY_BUFFER folded in; lets the
+        # per-call expiry check be a float compare instead of datetime math
+        self._expiry_monotonic: Optional[float] = None
         self.logger = logging.getLogger(__name__)
     
     def is_token_expired(self) -> bool:
         """
-        Check if the current token is expired.
-        
+        Check if the current token is expired or within the expiry buffer.
+
         Returns:
-            bool: True if token is expired or not set, False otherwise
+            bool: True if token is expired, near expiry or not set, False otherwise
         """
-        if self.token_expiry_datetime is None:
+        if self._expiry_monotonic is None:
             return True
-        return datetime.now(timezone.utc) > self.token_expiry_datetime
+        return time.monotonic() > self._expiry_monotonic
     
-    def refresh_token(self, host: str) -> str:
+    async def refresh_token(self, host: str) -> str:
         """
         Refresh the authentication token.
         
@@ -40,14 +48,19 @@ class TokenManager:
         """
         try:
             self.logger.info("Refreshing Databricks authentication token")
-            self.access_token, self.token_expiry_datetime = get_databricks_token(host)
+            self.access_token, self.token_expiry_datetime = await get_databricks_token(host)
+            if self.token_expiry_datetime is not None:
+                remaining = (self.token_expiry_datetime - datetime.now(timezone.utc)) - self.EXPIRY_BUFFER
+                self._expiry_monotonic = time.monotonic() + remaining.total_seconds()
+            else:
+                self._expiry_monotonic = None
             self.logger.info("Token refreshed successfully")
             return self.access_token
         except Exception as e:
             self.logger.error(f"Failed to refresh token: {e}")
             raise ValueError(f"Token refresh failed: {e}")
     
-    def get_valid_token(self, host: str) -> str:
+    async def get_valid_token(self, host: str) -> str:
         """
         Get a valid authentication token, refreshing if necessary.
         
@@ -61,5 +74,5 @@ class TokenManager:
             ValueError: If token cannot be obtained
         """
         if self.is_token_expired():
-            return self.refresh_token(host)
+            return await self.refresh_token(host)
         return self.access_token 
\ No newline at end of file
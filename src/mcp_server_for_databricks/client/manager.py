@@ -1,88 +1,190 @@
 """Databricks WorkspaceClient lifecycle management."""
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Optional
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 
 from mcp_server_for_databricks.auth.databricks_auth import databricks_login
 from mcp_server_for_databricks.auth.token_manager import TokenManager
+from mcp_server_for_databricks.config.models import AppConfig
+
+class MetadataCache:
+    """
+    TTL cache for metadata tool results keyed by the tool arguments.
+    Catalog and schema metadata change rarely, so repeated tool calls within
+    the TTL reuse the previous response instead of re-issuing REST calls.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 120.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._entries: dict = {}
+
+    async def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if time.monotonic() - timestamp > self._ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    async def set(self, key: tuple, value: Any) -> None:
+        """Store a value for key, evicting the oldest entry when full."""
+        async with self._lock:
+            if len(self._entries) >= self._maxsize:
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest_key]
+            self._entries[key] = (time.monotonic(), value)
 
 class ClientManager:
-    """Manages the Databricks WorkspaceClient and its authentication."""
-    
-    def __init__(self, config: Dict[str, Any]):
+    """Manages a bounded pool of Databricks WorkspaceClients and their authentication."""
+
+    def __init__(self, config: AppConfig, pool_size: int = 25):
         self.config = config
+        self.pool_size = pool_size
         self.client: Optional[WorkspaceClient] = None
         self.token_manager = TokenManager()
+        # Shared across all tool handlers created from this manager
+        self.metadata_cache = MetadataCache()
         self.logger = logging.getLogger(__name__)
         self._initialization_complete = False
-    
+        # Single-flight guard so concurrent tool calls share one
+        # initialization or refresh instead of stampeding
+        self._init_lock = asyncio.Lock()
+        self._pool: Optional[asyncio.Queue] = None
+        # (host, token) backing the current pool, used to skip rebuilds when
+        # a refresh resolves to credentials the pool already uses
+        self._pool_credentials: Optional[tuple] = None
+
+    def needs_initialization(self) -> bool:
+        """
+        Cheap synchronous check for whether initialize() would do any work.
+        Tool handlers call this before awaiting initialize(), so the
+        steady-state path costs an attribute load and a float compare
+        instead of a coroutine frame per request.
+        """
+        return not self._initialization_complete or self.token_manager.is_token_expired()
+
     async def initialize(self) -> None:
-        """Initialize the client and authentication."""
-        if self._initialization_complete and not self.token_manager.is_token_expired():
-            self.logger.info("Client already initialized and token is valid")
-            return
-        
-        if self.token_manager.is_token_expired():
-            self.logger.info("Token is expired, refreshing authentication")
-            await self._refresh_authentication()
-        else:
-            await self._full_initialization()
-    
+        """Initialize the client pool and authentication."""
+        async with self._init_lock:
+            # Re-check under the lock: another caller may have finished the
+            # work while we were waiting. Check expiry once and branch on the
+            # result, instead of re-reading the clock between decisions.
+            expired = self.token_manager.is_token_expired()
+            if self._initialization_complete and not expired:
+                self.logger.info("Client already initialized and token is valid")
+                return
+
+            if expired:
+                self.logger.info("Token is expired, refreshing authentication")
+                await self._refresh_authentication()
+            else:
+                await self._full_initialization()
+
     async def _full_initialization(self) -> None:
         """Perform full initialization including authentication."""
         self.logger.info("Performing full client initialization...")
-        
-        # Validate configuration
-        if not self.config.get("workspace", {}).get("url"):
-            raise ValueError("Missing workspace URL in configuration")
-        
-        databricks_host = self.config["workspace"]["url"]
+
+        # Presence and non-emptiness of the URL are enforced by the AppConfig
+        # model at load time, so a single attribute load suffices here
+        databricks_host = self.config.workspace.url
         self.logger.info(f"Initializing with Databricks host: {databricks_host}")
-        
+
         # Authenticate with Databricks
-        auth_result = await databricks_login(databricks_host)
+        auth_result = await databricks_login(databricks_host, token_manager=self.token_manager)
         if not auth_result:
             raise ValueError("Failed to authenticate with Databricks. Please check your credentials.")
-        
-        # Get token and create client
-        access_token = self.token_manager.get_valid_token(databricks_host)
-        self.client = WorkspaceClient(
-            host=databricks_host,
-            token=access_token
-        )
-        
-        self.logger.info("WorkspaceClient created successfully")
+
+        # Get token and create the client pool
+        access_token = await self.token_manager.get_valid_token(databricks_host)
+        self._rebuild_pool(databricks_host, access_token)
+
+        self.logger.info(f"WorkspaceClient pool of {self.pool_size} created successfully")
         self._initialization_complete = True
-    
+
     async def _refresh_authentication(self) -> None:
-        """Refresh authentication and recreate client."""
-        self.logger.info("Refreshing authentication and client...")
-        
-        databricks_host = self.config["workspace"]["url"]
-        access_token = self.token_manager.get_valid_token(databricks_host)
-        
-        self.client = WorkspaceClient(
+        """Refresh authentication and recreate the client pool."""
+        self.logger.info("Refreshing authentication and client pool...")
+
+        databricks_host = self.config.workspace.url
+        access_token = await self.token_manager.get_valid_token(databricks_host)
+
+        self._rebuild_pool(databricks_host, access_token)
+
+        self.logger.info("Client pool refreshed successfully")
+
+    def _rebuild_pool(self, databricks_host: str, access_token: str) -> None:
+        """Rebuild the client pool (and the direct client) with a fresh token."""
+        # A refresh can resolve to the same still-valid token; keep the
+        # existing pool and its warm HTTP sessions in that case
+        credentials = (databricks_host, access_token)
+        if self._pool is not None and self._pool_credentials == credentials:
+            self.logger.info("Credentials unchanged, keeping existing client pool")
+            return
+
+        # Resolve credentials once and share the Config between clients; each
+        # client still owns its HTTP session, sized for keepalive reuse so
+        # steady-state calls skip the TCP/TLS handshake
+        sdk_config = Config(
             host=databricks_host,
-            token=access_token
+            token=access_token,
+            max_connection_pools=20,
+            max_connections_per_pool=20
         )
-        
-        self.logger.info("Client refreshed successfully")
-    
+        pool: asyncio.Queue = asyncio.Queue(maxsize=self.pool_size)
+        for _ in range(self.pool_size):
+            pool.put_nowait(WorkspaceClient(config=sdk_config))
+        self._pool = pool
+        # Keep one direct handle for callers that do not need pooled checkout
+        self.client = WorkspaceClient(config=sdk_config)
+        self._pool_credentials = credentials
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Check a WorkspaceClient out of the pool, returning it on exit.
+        Concurrent tool calls each get their own client instead of serializing
+        on a single client's HTTP session.
+
+        Yields:
+            WorkspaceClient: A pooled client instance
+
+        Raises:
+            RuntimeError: If the pool is not initialized
+        """
+        if self._pool is None:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+        pool = self._pool
+        client = await pool.get()
+        try:
+            yield client
+        finally:
+            pool.put_nowait(client)
+
     def get_client(self) -> WorkspaceClient:
         """
         Get the WorkspaceClient instance.
-        
+
         Returns:
             WorkspaceClient: The initialized client
-            
+
         Raises:
             RuntimeError: If client is not initialized
         """
         if self.client is None:
             raise RuntimeError("Client not initialized. Call initialize() first.")
         return self.client
-    
+
     def is_initialized(self) -> bool:
         """Check if the client is initialized."""
-        return self._initialization_complete and self.client is not None 
\ No newline at end of file
+        return self._initialization_complete and self.client is not None
@@ -1,97 +1,94 @@
 """Configuration loading and validation."""
 
+import copy
 import yaml
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from pydantic import ValidationError
+
+# Prefer the libyaml-backed loader; fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from mcp_server_for_databricks.config.models import AppConfig, WorkspaceConfig
 
+# Parsed-and-validated configs keyed by (path, mtime_ns, size), so repeated
+# loads skip the disk read, the YAML parse and the validation pass unless the
+# file actually changed
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Located config path, resolved once; the directory walk only re-runs if the
+# cached path has since disappeared
+_CACHED_CONFIG_PATH: Optional[Path] = None
+
 def find_config_file() -> Path:
     """Find config.yaml file in project directory structure."""
+    global _CACHED_CONFIG_PATH
+    if _CACHED_CONFIG_PATH is not None and _CACHED_CONFIG_PATH.exists():
+        return _CACHED_CONFIG_PATH
+
     # Start from current working directory and work backwards
     current_path = Path.cwd()
     
     # Check current directory first
     config_path = current_path / "config.yaml"
     if config_path.exists():
+        _CACHED_CONFIG_PATH = config_path
         return config_path
     
     # Check parent directory (for when running from src/)
     parent_config = current_path.parent / "config.yaml"
     if parent_config.exists():
+        _CACHED_CONFIG_PATH = parent_config
         return parent_config
     
     # Check if we're in src/ and look in project root
     if current_path.name == "src":
         root_config = current_path.parent / "config.yaml"
         if root_config.exists():
+            _CACHED_CONFIG_PATH = root_config
             return root_config
     
     raise FileNotFoundError("config.yaml not found in current or parent directories")
 
-async def validate_config_structure(config: Dict[str, Any], logger: logging.Logger) -> bool:
+def validate_config_structure(config: Dict[str, Any], logger: logging.Logger) -> bool:
     """
     Validates that the config file has the correct structure.
-    
+
+    Validation runs through the AppConfig pydantic model, whose compiled
+    validator replaces the previous per-call field walk. The function is
+    synchronous since it does no I/O.
+
     Args:
         config: Configuration dictionary to validate
         logger: Logger instance to use
-    
+
     Returns:
         bool: True if structure is valid, False otherwise
     """
-    required_fields = {
-        "workspace": {
-            "url": str,
-            "warehouse_id": str,
-            "sample_size": int,
-            "warehouse_name": str
-        }
-    }
-    
-    optional_fields = {
-        "workspace": {
-            "catalog": str,
-            "profile": str,
-            "wait_timeout": str,
-            "save_table_metadata": bool
-        }
-    }
-    
     try:
         logger.info("Validating config structure...")
-        if "workspace" not in config:
-            logger.error("Missing 'workspace' section in config")
-            return False
-            
-        workspace = config["workspace"]
-        
-        # Check required fields
-        for field, field_type in required_fields["workspace"].items():
-            if field not in workspace:
-                logger.error(f"Missing required field '{field}' in workspace config")
-                return False
-            if not isinstance(workspace[field], field_type):
-                logger.error(f"Field '{field}' has incorrect type. Expected {field_type}, got {type(workspace[field])}")
-                return False
-        
-        # Check optional fields if present
-        for field, field_type in optional_fields["workspace"].items():
-            if field in workspace and not isinstance(workspace[field], field_type):
-                logger.error(f"Field '{field}' has incorrect type. Expected {field_type}, got {type(workspace[field])}")
-                return False
-                
+        AppConfig.model_validate(config)
         logger.info("Config structure validation successful")
         return True
+    except ValidationError as e:
+        logger.error("Config structure validation failed: %s", e.errors())
+        return False
     except Exception as e:
         logger.error(f"Error validating config structure: {str(e)}")
         return False
 
-async def load_config(logger: logging.Logger) -> Dict[str, Any]:
+def load_config(logger: logging.Logger) -> Dict[str, Any]:
     """
     Loads and validates configuration from config.yaml
+
+    Synchronous by design: the work is one small file read plus parsing, and
+    a coroutine frame per call buys nothing here.
     
     Args:
         logger: Logger instance to use
@@ -106,16 +103,27 @@ async def load_config(logger: logging.Logger) -> Dict[str, Any]:
         logger.info("Loading configuration from config.yaml...")
         config_path = find_config_file()
         logger.info(f"Found config file at: {config_path}")
-            
+
+        # Reuse the parsed config while the file is unchanged; deep-copied so
+        # callers mutating their copy cannot poison the cache
+        st = os.stat(config_path)
+        cache_key = (str(config_path), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Configuration unchanged on disk, using cached copy")
+            return copy.deepcopy(cached)
+
         with open(config_path, "r") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_YamlLoader)
             
-        if not await validate_config_structure(config_dict, logger):
+        if not validate_config_structure(config_dict, logger):
             logger.error("Invalid configuration structure")
             raise Exception(
                 "Invalid configuration structure. Please run init.py to reconfigure."
             )
         
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(config_dict)
         logger.info("Configuration loaded successfully")
         return config_dict
         
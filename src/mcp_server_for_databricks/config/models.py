@@ -1,11 +1,16 @@
 """Configuration data models."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class WorkspaceConfig(BaseModel):
     """Databricks workspace configuration."""
-    url: str = Field(..., description="Databricks workspace URL")
+    # Config is read-only after load: frozen skips the on-assignment
+    # validation path and makes instances hashable, extra="ignore" drops
+    # unknown-field bookkeeping
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    url: str = Field(..., min_length=1, description="Databricks workspace URL")
     warehouse_id: str = Field(..., description="SQL warehouse ID")
     warehouse_name: str = Field(..., description="SQL warehouse name")
     sample_size: int = Field(default=5, description="Default sample size for table data")
@@ -16,4 +21,6 @@ class WorkspaceConfig(BaseModel):
 
 class AppConfig(BaseModel):
     """Application configuration."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     workspace: WorkspaceConfig 
\ No newline at end of file
@@ -31,37 +31,40 @@ async def get_run_result(
         logger = logging.getLogger(__name__)
     
     try:
-        # Find the job ID
-        job_id = await asyncio.to_thread(
-            client.jobs.list,
-            name=job_name,
-            limit=1
+        # Find the job ID; take the first page item without materializing the pager
+        job = await asyncio.to_thread(
+            lambda: next(iter(client.jobs.list(name=job_name, limit=1)), None)
         )
 
-        if not job_id:
+        if job is None:
             logger.error(f"No job found with name: {job_name}")
             raise ValueError(f"No job found with name: {job_name}")
         
-        job_id = list(job_id)[0].job_id
+        job_id = job.job_id
 
         # Get the run ID
-        run_list = await asyncio.to_thread(
-            client.jobs.list_runs,
-            job_id=job_id,
-            completed_only=True,
-        )
-        
         run_id = None
         if not filter_for_failed_runs:
-            run_id = list(run_list)[0].run_id
+            # Only the newest completed run is needed, so request a single-item page
+            run = await asyncio.to_thread(
+                lambda: next(iter(client.jobs.list_runs(job_id=job_id, completed_only=True, limit=1)), None)
+            )
+            if run is not None:
+                run_id = run.run_id
         else:
-            for run in run_list:
-                if run.state.result_state.value == "FAILED":
-                    run_id = run.run_id
-                    break
-            if run_id is None:
+            # Walk the lazy pager and stop at the first failed run instead of
+            # paging through the entire run history up front
+            def _first_failed_run():
+                for run in client.jobs.list_runs(job_id=job_id, completed_only=True, limit=25):
+                    if run.state.result_state.value == "FAILED":
+                        return run
+                return None
+
+            run = await asyncio.to_thread(_first_failed_run)
+            if run is None:
                 logger.error(f"No failed runs found for job: {job_name}")
                 raise ValueError(f"No failed runs found for job: {job_name}")
+            run_id = run.run_id
         
         if run_id is None:
             logger.error(f"No runs found for job: {job_name}")
@@ -73,13 +76,17 @@ async def get_run_result(
             run_id=run_id
         )
         
-        last_failed_id = None
-        last_timestamp = -999
-        for task in run_result.tasks:
-            if task.end_time > last_timestamp:
-                if not filter_for_failed_runs or task.state.result_state.value == 'FAILED':
-                    last_failed_id = task.run_id
-                    last_timestamp = task.end_time
+        # Pick the latest matching task with C-level max() over a pre-filtered
+        # generator instead of manual sentinel tracking
+        candidates = (
+            task for task in run_result.tasks
+            if not filter_for_failed_runs or task.state.result_state.value == 'FAILED'
+        )
+        latest_task = max(candidates, key=lambda task: task.end_time, default=None)
+        if latest_task is None:
+            logger.error(f"No matching task runs found for job: {job_name}")
+            raise ValueError(f"No matching task runs found for job: {job_name}")
+        last_failed_id = latest_task.run_id
         
         run_result_output = await asyncio.to_thread(
             client.jobs.get_run_output,
@@ -5,6 +5,8 @@ import asyncio
 from typing import Optional, List, Dict, Any
 from databricks.sdk import WorkspaceClient
 
+from mcp_server_for_databricks.databricks.tables import seed_table_metadata_cache
+
 async def get_schema_list(
     client: WorkspaceClient,
     catalog: str,
@@ -28,12 +30,21 @@ async def get_schema_list(
         logger = logging.getLogger(__name__)
     
     try:
+        # Drain the pager and project just the fields callers use inside the
+        # worker thread; the SDK's generic as_dict() reflects over every
+        # attribute and the old trailing list() re-wrapped an existing list
         schema_list = await asyncio.to_thread(
-            client.schemas.list,
-            catalog_name=catalog
+            lambda: [
+                {
+                    "name": s.name,
+                    "full_name": s.full_name,
+                    "comment": s.comment,
+                    "owner": s.owner,
+                }
+                for s in client.schemas.list(catalog_name=catalog)
+            ]
         )
-        schema_list = [i.as_dict() for i in schema_list]
-        return list(schema_list)
+        return schema_list
     except Exception as e:
         logger.error(f"Error getting schema list: {str(e)}")
         raise
@@ -71,22 +82,34 @@ async def get_schema_metadata(
         logger = logging.getLogger(__name__)
     
     try:
-        # Get the comment for the schema if it exists
-        schema_comment = client.schemas.get(f"{catalog_name}.{schema_name}").comment
-        tables = client.tables.list(catalog_name, schema_name)
-        
+        # The schema lookup and the table listing are independent; run them
+        # concurrently in worker threads so the two round-trips overlap.
+        # tables.list is a sync generator that fetches pages from the REST
+        # API, so it is drained inside its thread
+        schema_info, tables = await asyncio.gather(
+            asyncio.to_thread(client.schemas.get, f"{catalog_name}.{schema_name}"),
+            asyncio.to_thread(lambda: list(client.tables.list(
+                catalog_name, schema_name, include_delta_metadata=True
+            )))
+        )
+
+        # The listing already carries full TableInfo for every table in the
+        # schema; seed the per-table metadata cache so follow-up sample calls
+        # skip their individual tables.get round trips
+        seed_table_metadata_cache(tables)
+
         schema_metadata = {
-            'schema_comment': schema_comment,
-            'tables': {}
-        }
-        
-        for table in tables:
-            schema_metadata['tables'][table.name] = {
-                'comment': table.comment,
-                'created_at': table.created_at,
-                'table_type': table.table_type,
-                'owner': table.owner
+            'schema_comment': schema_info.comment,
+            'tables': {
+                table.name: {
+                    'comment': table.comment,
+                    'created_at': table.created_at,
+                    'table_type': table.table_type,
+                    'owner': table.owner
+                }
+                for table in tables
             }
+        }
         
         return schema_metadata
     except Exception as e:
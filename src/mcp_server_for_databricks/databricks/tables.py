@@ -1,12 +1,148 @@
 """Databricks table operations."""
 
+import copy
+import operator
+import re
 import logging
 import asyncio
 import os
 import json
+import time
+from pathlib import Path
 from typing import Optional, Dict, Any
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import ExecuteStatementRequest, Disposition, Format, ExecuteStatementRequestOnWaitTimeout, StatementState
+from databricks.sdk.service.sql import ExecuteStatementRequest, Disposition, Format, ExecuteStatementRequestOnWaitTimeout, StatementState, StatementParameterListItem
+
+# Prefer orjson's C serializer for the metadata dumps when it is installed;
+# stdlib json with indent is a Python-level pretty-printer and much slower
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Table metadata cache keyed by fully qualified table name. Schema changes
+# are human-scale events, so repeated samples within the TTL reuse the last
+# Tables API response instead of paying the round-trip again. Entries are
+# deep-copied both ways because callers attach sample values to the result.
+_TABLE_META_CACHE: Dict[tuple, tuple] = {}
+_TABLE_META_TTL = 300.0
+
+# Identifier pre-check: a malformed name would only be rejected after a full
+# warehouse round trip (parse error, no plan cache); failing it here is free
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# One constant statement for every sample: the table name goes through the
+# IDENTIFIER clause and the limit through a bind parameter, so the warehouse
+# sees identical SQL text for all tables and can reuse the cached plan, and
+# no identifier is ever spliced into the query string
+_SAMPLE_QUERY = "SELECT * FROM IDENTIFIER(:tbl) LIMIT :n"
+
+# States that mean the statement is still settling; bound once so the poll
+# loop tests membership against a constant instead of rebuilding a tuple
+# every iteration
+_RUNNING_STATES = frozenset((StatementState.PENDING, StatementState.RUNNING))
+
+# Field projections bound once at import; attrgetter fetches all attributes
+# in one C-level call instead of one bytecode round-trip per field, which
+# matters when wide tables bring hundreds of columns through here
+_TABLE_KEYS = (
+    'name', 'catalog_name', 'schema_name', 'table_type', 'data_source_format',
+    'comment', 'properties', 'storage_location', 'view_definition', 'table_id',
+    'created_at', 'updated_at', 'deleted_at', 'row_filter', 'owner'
+)
+_TABLE_ATTRS = operator.attrgetter(*_TABLE_KEYS)
+_COL_KEYS = ('name', 'type_name', 'comment', 'nullable', 'partition_index', 'mask')
+_COL_ATTRS = operator.attrgetter(*_COL_KEYS)
+
+def _table_info_to_dict(table_info) -> Dict[str, Any]:
+    """Project a TableInfo onto the metadata dict shape the tools return."""
+    table_dict = dict(zip(_TABLE_KEYS, _TABLE_ATTRS(table_info)))
+    table_dict["columns"] = (
+        [dict(zip(_COL_KEYS, _COL_ATTRS(col))) for col in table_info.columns]
+        if table_info.columns else []
+    )
+    # The Delta payload arrives as a typed wrapper; flatten it to the plain
+    # properties dict so the result stays JSON-serializable
+    delta = table_info.delta_runtime_properties_kvpairs
+    table_dict["delta_runtime_properties"] = (
+        delta.delta_runtime_properties if delta else None
+    )
+    return table_dict
+
+def seed_table_metadata_cache(tables) -> None:
+    """
+    Prefill the table metadata cache from a bulk tables.list response.
+    A schema walk already fetches every table in one round trip; storing the
+    results here lets subsequent per-table calls skip their tables.get
+    request entirely instead of repeating it N times (the classic N+1).
+    Entries without column details are skipped so a later real fetch is not
+    shadowed by a partial one.
+    """
+    now = time.monotonic()
+    for table_info in tables:
+        if not table_info.columns:
+            continue
+        key = (table_info.catalog_name, table_info.schema_name, table_info.name)
+        _TABLE_META_CACHE[key] = (now, _table_info_to_dict(table_info))
+
+def _dump_json(path: str, obj: Any) -> None:
+    """Write obj to path as indented JSON, via orjson when available."""
+    if _orjson is not None:
+        with open(path, "wb") as f:
+            f.write(_orjson.dumps(obj, option=_orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=4)
+
+async def _execute_and_wait(
+    client: WorkspaceClient,
+    warehouse_id: str,
+    statement: str,
+    wait_timeout: str,
+    parameters: list,
+    logger: logging.Logger
+):
+    """
+    Submit a statement and return its completed result.
+    The request holds open for the full wait_timeout so the result arrives
+    inline on the happy path (queries that blow through it are cancelled);
+    the rare still-settling statement is polled with exponential backoff.
+
+    Raises:
+        ValueError: If the statement finishes in any state but SUCCEEDED
+    """
+    response = await asyncio.to_thread(
+        client.statement_execution.execute_statement,
+        warehouse_id=warehouse_id,
+        statement=statement,
+        wait_timeout=wait_timeout,
+        on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CANCEL,
+        disposition=Disposition.INLINE,  # Get results inline
+        format=Format.JSON_ARRAY,  # Use JSON array format
+        parameters=parameters
+    )
+
+    statement_id = response.statement_id
+    logger.info("Statement ID: %s", statement_id)
+
+    result = response
+    delay = 0.1
+    while result.status.state in _RUNNING_STATES:
+        # Per-iteration state is diagnostic noise at INFO during long polls
+        logger.debug("Statement state: %s", result.status.state)
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.6, 2.0)
+        result = await asyncio.to_thread(
+            client.statement_execution.get_statement, statement_id
+        )
+
+    if result.status.state != StatementState.SUCCEEDED:
+        error_message = f"Statement execution failed with state: {result.status.state}"
+        if result.status.error:
+            error_message += f", Error: {result.status.error.message}"
+        raise ValueError(error_message)
+
+    return result
 
 async def get_table_sample(
     client: WorkspaceClient,
@@ -15,7 +151,7 @@ async def get_table_sample(
     schema: str,
     table: str,
     sample_size: int = 5,
-    wait_timeout: str = "30s",
+    wait_timeout: str = "50s",
     save_table_metadata: bool = False,
     logger: Optional[logging.Logger] = None
 ) -> Dict[str, Any]:
@@ -47,71 +183,69 @@ async def get_table_sample(
         # Validate warehouse_id
         if not warehouse_id:
             raise ValueError("Warehouse ID is required")
-        
-        # Build the query
-        query = f"SELECT * FROM {catalog}.{schema}.{table} LIMIT {sample_size}"
-        logger.info(f"Executing query: {query}")
+
+        # Reject malformed identifiers before paying a warehouse round trip
+        for part in (catalog, schema, table):
+            if not _IDENT_RE.match(part):
+                raise ValueError(f"Invalid identifier: {part!r}")
+
+        full_table_name = f"{catalog}.{schema}.{table}"
+        logger.info("Executing query: %s with tbl=%s", _SAMPLE_QUERY, full_table_name)
         
         # Execute the query with error handling
-        try:
-            # Execute the statement with proper parameters
-            response = client.statement_execution.execute_statement(
-                warehouse_id=warehouse_id,
-                statement=query,
-                wait_timeout=wait_timeout,  
-                on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,  # Continue asynchronously if timeout
-                disposition=Disposition.INLINE,  # Get results inline
-                format=Format.JSON_ARRAY  # Use JSON array format
-            )
-            
-            # Get the statement ID
-            statement_id = response.statement_id
-            logger.info(f"Statement ID: {statement_id}")
-            
-            # Get the result using the statement ID
-            result = client.statement_execution.get_statement(statement_id)
-            
-            # Check if the statement is still running
-            while result.status.state in ["PENDING", "RUNNING"]:
-                logger.info(f"Statement state: {result.status.state}")
-                await asyncio.sleep(1)  # Wait for 1 second before checking again
-                result = client.statement_execution.get_statement(statement_id)
-            
-            if result.status.state != StatementState.SUCCEEDED:
-                error_message = f"Statement execution failed with state: {result.status.state}"
-                if result.status.error:
-                    error_message += f", Error: {result.status.error.message}"
-                raise ValueError(error_message)
-            
-        except Exception as e:
-            logger.error(f"Failed to execute query: {str(e)}")
-            raise ValueError(f"Failed to execute query: {str(e)}")
+        async def _run_sample_query():
+            try:
+                return await _execute_and_wait(
+                    client,
+                    warehouse_id,
+                    _SAMPLE_QUERY,
+                    wait_timeout,
+                    [
+                        StatementParameterListItem(name="tbl", value=full_table_name),
+                        StatementParameterListItem(name="n", value=str(sample_size), type="INT")
+                    ],
+                    logger
+                )
+            except Exception as e:
+                logger.error("Failed to execute query: %s", e)
+                # Chain the cause so the SDK traceback survives the rewrap
+                raise ValueError(f"Failed to execute query: {e}") from e
 
-        sample_data = result.result.as_dict()['data_array']
-        basic_schema = result.manifest.schema.as_dict()['columns']
-        column_names = [col['name'] for col in basic_schema]
-        
-        sample_dict = [dict(zip(column_names, row)) for row in sample_data]
-        
-        # Get detailed table metadata using table_metadata_call
+        # The sample query and the metadata lookup hit independent endpoints;
+        # overlap them so the tool waits for the slower of the two instead of
+        # their sum
         logger.info(f"Retrieving detailed metadata for {catalog}.{schema}.{table}")
-        table_metadata = await table_metadata_call(
-            client=client,
-            catalog_name=catalog,
-            schema_name=schema,
-            table_name=table,
-            logger=logger
+        result, table_metadata = await asyncio.gather(
+            _run_sample_query(),
+            table_metadata_call(
+                client=client,
+                catalog_name=catalog,
+                schema_name=schema,
+                table_name=table,
+                logger=logger
+            )
         )
 
+        # Read rows and column names straight off the response objects;
+        # as_dict() would deep-convert the whole payload just to index into it
+        sample_data = result.result.data_array or []
+        column_names = [col.name for col in result.manifest.schema.columns]
+
+        # Transpose the row-major sample once into per-column tuples; building
+        # a dict per row just to pull values back out per column is O(rows x
+        # cols) hashing for nothing
+        columns_data = list(zip(*sample_data)) if sample_data else []
+        column_index = {name: idx for idx, name in enumerate(column_names)}
+
         # Integrate sample values into table_metadata
-        if table_metadata and 'columns' in table_metadata and sample_dict:
+        if table_metadata and 'columns' in table_metadata and columns_data:
             for column_info in table_metadata['columns']:
-                column_name = column_info['name']
-                # Extract sample values for this column, handling potential missing keys
-                column_sample_values = [row.get(column_name) for row in sample_dict if column_name in row]
-                column_info['sample_values'] = column_sample_values
+                idx = column_index.get(column_info['name'])
+                column_info['sample_values'] = list(columns_data[idx]) if idx is not None else []
         
         if save_table_metadata:
+            # Row-oriented dicts are only needed for the JSON dump on disk
+            sample_dict = [dict(zip(column_names, row)) for row in sample_data]
             await _save_table_data(catalog, schema, table, sample_dict, table_metadata, logger)
         
         logger.info(f"Retrieved sample data and detailed metadata for {catalog}.{schema}.{table} table")
@@ -155,48 +289,26 @@ async def table_metadata_call(
         if not catalog_name or not schema_name or not table_name:
             raise ValueError("Catalog name, schema name, and table name are all required")
             
+        key = (catalog_name, schema_name, table_name)
+        hit = _TABLE_META_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _TABLE_META_TTL:
+            logger.info(f"Using cached metadata for table {catalog_name}.{schema_name}.{table_name}")
+            return copy.deepcopy(hit[1])
+
         logger.info(f"Fetching metadata for table {catalog_name}.{schema_name}.{table_name}")
         
         # Use the Tables API to get detailed table information
         # This uses the native SDK endpoint, not SQL queries like other functions
         table_info = await asyncio.to_thread(
             client.tables.get,
-            full_name=f"{catalog_name}.{schema_name}.{table_name}"
+            full_name=f"{catalog_name}.{schema_name}.{table_name}",
+            include_delta_metadata=True
         )
         
         # Convert TableInfo to dictionary
-        table_dict = {
-            "name": table_info.name,
-            "catalog_name": table_info.catalog_name,
-            "schema_name": table_info.schema_name,
-            "table_type": table_info.table_type,
-            "data_source_format": table_info.data_source_format,
-            "columns": [],
-            "comment": table_info.comment,
-            "properties": table_info.properties,
-            "storage_location": table_info.storage_location,
-            "view_definition": table_info.view_definition,
-            "table_id": table_info.table_id,
-            "created_at": table_info.created_at,
-            "updated_at": table_info.updated_at,
-            "deleted_at": table_info.deleted_at,
-            "row_filter": table_info.row_filter,
-            "owner": table_info.owner
-        }
-        
-        # Add column details
-        if table_info.columns:
-            for col in table_info.columns:
-                column_info = {
-                    "name": col.name,
-                    "type_name": col.type_name,
-                    "comment": col.comment,
-                    "nullable": col.nullable,
-                    "partition_index": col.partition_index,
-                    "mask": col.mask
-                }
-                table_dict["columns"].append(column_info)
-        
+        table_dict = _table_info_to_dict(table_info)
+
+        _TABLE_META_CACHE[key] = (time.monotonic(), copy.deepcopy(table_dict))
         logger.info(f"Successfully retrieved metadata for table {catalog_name}.{schema_name}.{table_name}")
         return table_dict
         
@@ -207,6 +319,135 @@ async def table_metadata_call(
         logger.error(f"Error retrieving table metadata: {str(e)}")
         raise Exception(f"Failed to retrieve table metadata: {str(e)}")
 
+# Once .gitignore is known to contain the .input_data entry, later saves in
+# the same process skip the read entirely
+_GITIGNORE_READY = False
+
+def _persist_sample(
+    catalog: str,
+    schema: str,
+    table: str,
+    sample_dict: list,
+    table_metadata: dict
+) -> str:
+    """Blocking save of the sample and metadata dumps; runs in a worker thread."""
+    global _GITIGNORE_READY
+    # Create the nested table folder in one call instead of stat-then-make
+    # per path level
+    table_folder = f"./.input_data/{catalog}/{schema}/{table}"
+    os.makedirs(table_folder, exist_ok=True)
+
+    # Keep .input_data ignored, appending only when the entry is missing
+    # so the file does not grow by one line per save; checked at most once
+    # per process
+    if not _GITIGNORE_READY:
+        gitignore = Path("./.gitignore")
+        if not gitignore.exists() or ".input_data" not in gitignore.read_text():
+            with gitignore.open("a") as f:
+                f.write(".input_data\n")
+        _GITIGNORE_READY = True
+
+    # Save sample data
+    _dump_json(f"{table_folder}/sample_data.json", sample_dict)
+
+    # Save detailed table metadata instead of basic schema
+    _dump_json(f"{table_folder}/table_metadata.json", table_metadata)
+    return table_folder
+
+async def get_table_samples_bulk(
+    client: WorkspaceClient,
+    warehouse_id: str,
+    triples: list,
+    sample_size: int = 5,
+    wait_timeout: str = "50s",
+    save_table_metadata: bool = False,
+    logger: Optional[logging.Logger] = None,
+    concurrency: int = 8
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Sample several tables concurrently.
+    Statements are submitted immediately and their waits overlap, bounded by
+    a semaphore so the warehouse sees at most `concurrency` in-flight
+    queries; N tables complete in roughly the slowest sample's latency
+    instead of the sum.
+
+    Args:
+        client: Authenticated WorkspaceClient instance
+        warehouse_id: ID of the SQL warehouse to use
+        triples: (catalog, schema, table) tuples to sample
+        sample_size: Number of sample rows per table
+        wait_timeout: Query wait timeout
+        save_table_metadata: Whether to save metadata to files
+        logger: Logger instance to use (optional)
+        concurrency: Maximum number of concurrent sample queries
+
+    Returns:
+        Dictionary mapping each qualified table name to its metadata with
+        integrated sample values
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _bounded(catalog: str, schema: str, table: str) -> Dict[str, Any]:
+        async with sem:
+            return await get_table_sample(
+                client=client,
+                warehouse_id=warehouse_id,
+                catalog=catalog,
+                schema=schema,
+                table=table,
+                sample_size=sample_size,
+                wait_timeout=wait_timeout,
+                save_table_metadata=save_table_metadata,
+                logger=logger
+            )
+
+    results = await asyncio.gather(*(_bounded(*triple) for triple in triples))
+    return {".".join(triple): result for triple, result in zip(triples, results)}
+
+async def table_metadata_many(
+    client: WorkspaceClient,
+    full_names: list,
+    logger: Optional[logging.Logger] = None,
+    concurrency: int = 16
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch metadata for several tables concurrently.
+    Each lookup goes through table_metadata_call (and therefore its cache);
+    a semaphore caps the in-flight requests so a large schema walk is
+    ceil(N / concurrency) round trips instead of N sequential ones without
+    flooding the API.
+
+    Args:
+        client: Authenticated WorkspaceClient instance
+        full_names: Fully qualified table names (catalog.schema.table)
+        logger: Logger instance to use (optional)
+        concurrency: Maximum number of concurrent metadata requests
+
+    Returns:
+        Dictionary mapping each full name to its metadata dictionary
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _fetch(full_name: str) -> Dict[str, Any]:
+        catalog_name, schema_name, table_name = full_name.split(".", 2)
+        async with sem:
+            return await table_metadata_call(
+                client=client,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                table_name=table_name,
+                logger=logger
+            )
+
+    results = await asyncio.gather(*(_fetch(name) for name in full_names))
+    return dict(zip(full_names, results))
+
 async def _save_table_data(
     catalog: str,
     schema: str,
@@ -217,30 +458,11 @@ async def _save_table_data(
 ) -> None:
     """Save table sample data and metadata to files."""
     try:
-        # Check if .input_data folder exists, if not create it
-        if not os.path.exists("./.input_data"):
-            os.makedirs("./.input_data")
-            # Add .input_data to .gitignore
-            if not os.path.exists("./.gitignore"):
-                with open("./.gitignore", "w") as f:
-                    f.write(".input_data\n")
-            else:
-                with open("./.gitignore", "a") as f:
-                    f.write(".input_data\n")
-
-        # Create a folder for the table
-        table_folder = f"./.input_data/{catalog}/{schema}/{table}"
-        if not os.path.exists(table_folder):
-            os.makedirs(table_folder)
-            
-        # Save sample data
-        with open(f"{table_folder}/sample_data.json", "w") as f:
-            json.dump(sample_dict, f, indent=4)
-            
-        # Save detailed table metadata instead of basic schema
-        with open(f"{table_folder}/table_metadata.json", "w") as f:
-            json.dump(table_metadata, f, indent=4)
-        
+        # The directory and JSON writes are blocking; keep them off the event
+        # loop so concurrent tool calls are not stalled by a large dump
+        table_folder = await asyncio.to_thread(
+            _persist_sample, catalog, schema, table, sample_dict, table_metadata
+        )
         logger.info(f"Saved table data to {table_folder}")
     except Exception as e:
         logger.error(f"Error saving table data: {e}")
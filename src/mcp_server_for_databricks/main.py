@@ -1,6 +1,16 @@
 """Main entry point for MCP Databricks server."""
 
 import asyncio
+
+# Use the libuv-backed event loop when available; the tools are pure I/O, so
+# lower per-await scheduling cost translates directly into dispatch throughput.
+# Falls back silently where uvloop is absent (e.g. Windows).
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from mcp_server_for_databricks.app import MCPDatabricksApp
 
 async def main():
@@ -13,17 +23,15 @@ def run_server():
     """Run the MCP server."""
     # Create the app
     app = MCPDatabricksApp()
-    
-    # Initialize the app synchronously (letting FastMCP handle the event loop)
-    async def init_app():
+
+    async def serve():
+        # Initialize and serve on one event loop; splitting them across
+        # asyncio.run and FastMCP's own loop would discard the default
+        # executor and any loop-bound client state warmed during init
         await app.initialize()
-        return app
-    
-    # Initialize first
-    initialized_app = asyncio.run(init_app())
-    
-    # Then run the server (FastMCP will create its own event loop)
-    initialized_app.run(transport='stdio')
+        await app.get_mcp_server().run_stdio_async()
+
+    asyncio.run(serve())
 
 if __name__ == "__main__":
     run_server() 
\ No newline at end of file
@@ -1,6 +1,7 @@
 """MCP tool registry and server setup."""
 
 import logging
+import weakref
 from typing import Dict, Any
 from fastapi import HTTPException
 from mcp.server.fastmcp import FastMCP
@@ -10,18 +11,32 @@ from mcp_server_for_databricks.databricks.schemas import get_schema_list, get_sc
 from mcp_server_for_databricks.databricks.tables import get_table_sample
 from mcp_server_for_databricks.databricks.jobs import get_run_result
 
+# One FastMCP server per client manager; repeat calls (the smoke tests build
+# the app more than once) reuse the registered tools instead of re-creating
+# the closures and registry entries
+_SERVERS: "weakref.WeakKeyDictionary[ClientManager, FastMCP]" = weakref.WeakKeyDictionary()
+
 def create_mcp_server(client_manager: ClientManager) -> FastMCP:
     """
     Create and configure the MCP server with all tools.
-    
+    Memoized per client manager: calling this again with the same manager
+    returns the already-configured server.
+
     Args:
         client_manager: Initialized client manager
-        
+
     Returns:
         Configured FastMCP server
     """
+    existing = _SERVERS.get(client_manager)
+    if existing is not None:
+        return existing
+
     mcp = FastMCP("mcp_unity")
     logger = logging.getLogger(__name__)
+    # The config model is frozen, so the workspace section can be bound once
+    # here and read as a plain local in every tool invocation
+    workspace_config = client_manager.config.workspace
 
     @mcp.tool()
     async def get_schemas_2(catalog: str):
@@ -29,20 +44,28 @@ def create_mcp_server(client_manager: ClientManager) -> FastMCP:
         Get all schemas and their tables in the workspace for the default catalog.
         """
         try:
-            await client_manager.initialize()
-            client = client_manager.get_client()
-            
-            logger.info(f"Getting schemas for catalog: {catalog}")
-            schemas = await get_schema_list(
-                client,
-                catalog=catalog,
-                logger=logger
-            )
-            
+            if client_manager.needs_initialization():
+                await client_manager.initialize()
+
+            cache_key = ("schemas", catalog)
+            cached = await client_manager.metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached schema list for catalog: %s", catalog)
+                return cached
+
+            async with client_manager.acquire() as client:
+                logger.info("Getting schemas for catalog: %s", catalog)
+                schemas = await get_schema_list(
+                    client,
+                    catalog=catalog,
+                    logger=logger
+                )
+
+            await client_manager.metadata_cache.set(cache_key, schemas)
             return schemas
         
         except Exception as e:
-            logger.error(f"Error getting schemas: {str(e)}")
+            logger.error("Error getting schemas: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @mcp.tool()
@@ -58,32 +81,29 @@ def create_mcp_server(client_manager: ClientManager) -> FastMCP:
             Dictionary with detailed table metadata including sample values.
         """
         try:
-            await client_manager.initialize()
-            client = client_manager.get_client()
-            
-            logger.info(f"Getting table metadata and sample data for {catalog}.{schema_name}.{table}")
-
-            # Get configuration from client manager
-            config = client_manager.config
-            workspace_config = config["workspace"]
-            
-            # Call get_table_sample which now returns only metadata with integrated sample values
-            table_metadata = await get_table_sample(
-                client=client,
-                warehouse_id=workspace_config["warehouse_id"],
-                catalog=catalog,
-                schema=schema_name,
-                table=table,
-                sample_size=workspace_config.get("sample_size", 5),
-                wait_timeout=workspace_config.get("wait_timeout", "30s"),
-                save_table_metadata=workspace_config.get("save_table_metadata", False),
-                logger=logger
-            )
+            if client_manager.needs_initialization():
+                await client_manager.initialize()
+
+            logger.info("Getting table metadata and sample data for %s.%s.%s", catalog, schema_name, table)
+
+            async with client_manager.acquire() as client:
+                # Call get_table_sample which now returns only metadata with integrated sample values
+                table_metadata = await get_table_sample(
+                    client=client,
+                    warehouse_id=workspace_config.warehouse_id,
+                    catalog=catalog,
+                    schema=schema_name,
+                    table=table,
+                    sample_size=workspace_config.sample_size,
+                    wait_timeout=workspace_config.wait_timeout,
+                    save_table_metadata=workspace_config.save_table_metadata,
+                    logger=logger
+                )
 
             # Return the comprehensive metadata dictionary
             return table_metadata
         except Exception as e:
-            logger.error(f"Error getting table sample: {str(e)}")
+            logger.error("Error getting table sample: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
 
     @mcp.tool()
@@ -108,18 +128,26 @@ def create_mcp_server(client_manager: ClientManager) -> FastMCP:
             }
         """
         try:
-            await client_manager.initialize()
-            client = client_manager.get_client()
-            
-            schema_metadata = await get_schema_metadata(
-                client=client,
-                catalog_name=catalog_name,
-                schema_name=schema_name,
-                logger=logger
-            )
+            if client_manager.needs_initialization():
+                await client_manager.initialize()
+
+            cache_key = ("schema_metadata", catalog_name, schema_name)
+            cached = await client_manager.metadata_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached schema metadata for %s.%s", catalog_name, schema_name)
+                return cached
+
+            async with client_manager.acquire() as client:
+                schema_metadata = await get_schema_metadata(
+                    client=client,
+                    catalog_name=catalog_name,
+                    schema_name=schema_name,
+                    logger=logger
+                )
+            await client_manager.metadata_cache.set(cache_key, schema_metadata)
             return schema_metadata
         except Exception as e:
-            logger.error(f"Error getting schema metadata: {str(e)}")
+            logger.error("Error getting schema metadata: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
         
     @mcp.tool()
@@ -136,27 +164,29 @@ def create_mcp_server(client_manager: ClientManager) -> FastMCP:
             A string containing the error message, error traceback, and metadata for the selected run.
         """
         try:
-            await client_manager.initialize()
-            client = client_manager.get_client()
+            if client_manager.needs_initialization():
+                await client_manager.initialize()
 
-            logger.info(f"Getting run result for job '{job_name}', filter_for_failed_runs={filter_for_failed_runs}")
+            logger.info("Getting run result for job '%s', filter_for_failed_runs=%s", job_name, filter_for_failed_runs)
 
             # Call the utility function from jobs.py
-            run_result_output = await get_run_result(
-                job_name=job_name,
-                client=client,
-                logger=logger,
-                filter_for_failed_runs=filter_for_failed_runs
-            )
-
-            logger.info(f"Successfully retrieved run result for job '{job_name}'")
+            async with client_manager.acquire() as client:
+                run_result_output = await get_run_result(
+                    job_name=job_name,
+                    client=client,
+                    logger=logger,
+                    filter_for_failed_runs=filter_for_failed_runs
+                )
+
+            logger.info("Successfully retrieved run result for job '%s'", job_name)
             return run_result_output
 
         except ValueError as ve:
-            logger.error(f"Value error getting run result for job '{job_name}': {str(ve)}")
+            logger.error("Value error getting run result for job '%s': %s", job_name, ve)
             raise HTTPException(status_code=404, detail=str(ve)) # 404 if job/run not found
         except Exception as e:
-            logger.error(f"Error getting run result for job '{job_name}': {type(e).__name__}: {str(e)}")
+            logger.error("Error getting run result for job '%s': %s: %s", job_name, type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"Failed to get run result: {str(e)}")
 
+    _SERVERS[client_manager] = mcp
     return mcp 
\ No newline at end of file
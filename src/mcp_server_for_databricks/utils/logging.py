@@ -1,68 +1,200 @@
 """Logging configuration and utilities."""
 
 import sys
+import atexit
 import logging
+import io
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional
 
-def setup_logging(log_dir: str = ".logs", log_filename: str = "mcp_unity.log") -> logging.Logger:
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a 64 KiB stream buffer instead of
+    issuing one write()+flush() syscall pair per record. Durability comes from
+    a periodic background flush plus an immediate flush for ERROR and above.
+    """
+
+    _BUFFER_SIZE = 65536
+    _FLUSH_INTERVAL = 30.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flush_timer: Optional[threading.Timer] = None
+        self._schedule_flush()
+
+    def _open(self):
+        # Same as FileHandler._open but with an explicit 64 KiB buffer, so
+        # records coalesce into few large writes
+        return io.open(self.baseFilename, self.mode, buffering=self._BUFFER_SIZE,
+                       encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record; skip that and let
+        # the buffer, the timer and the ERROR fast path decide when to sync
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _schedule_flush(self):
+        self._flush_timer = threading.Timer(self._FLUSH_INTERVAL, self._timed_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        finally:
+            self._schedule_flush()
+
+    def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        super().close()
+
+# Listener draining the log queue on its background thread; module-level so a
+# reconfiguration can stop the previous one before starting a replacement
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    """Stop the active queue listener, draining pending records. Idempotent."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+class _FastFormatter(logging.Formatter):
+    """
+    Formatter that renders the fixed record layout with one f-string instead
+    of running the %-format engine over '%(asctime)s - %(name)s - ...' per
+    record. Exception and stack text are appended the same way the base
+    class does.
+    """
+
+    def format(self, record):
+        s = (f"{self.formatTime(record)} - {record.name} - "
+             f"{record.levelname} - {record.getMessage()}")
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = s + "\n" + record.exc_text
+        if record.stack_info:
+            s = s + "\n" + self.formatStack(record.stack_info)
+        return s
+
+# One formatter instance for every handler, built once at import; the msec
+# format is precomputed so asctime rendering stays cheap per record
+_FORMATTER = _FastFormatter()
+_FORMATTER.default_msec_format = '%s.%03d'
+
+# Set once the handlers are wired up; repeat setup_logging calls then return
+# the root logger without re-doing directory, handler and listener work
+_LOGGING_INITIALIZED = False
+
+def setup_logging(log_dir: str = ".logs", log_filename: str = "mcp_unity.log",
+                  transport: Optional[str] = None, force: bool = False) -> logging.Logger:
     """
     Set up logging configuration to write to a file and console.
-    Creates the log directory if it doesn't exist.
-    
+    Creates the log directory if it doesn't exist. Configuration runs once
+    per process; later calls return the already-configured root logger
+    unless force is True.
+
     Args:
         log_dir: Directory to store log files
         log_filename: Name of the log file
-        
+        transport: MCP transport in use; console output is suppressed for
+            'stdio' since stdout carries the RPC channel
+        force: Reconfigure even if logging was already set up
+
     Returns:
         Configured root logger
     """
-    # Create log directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-    
+    global _queue_listener, _LOGGING_INITIALIZED
+
+    if _LOGGING_INITIALIZED and not force:
+        return logging.getLogger()
+
+    # Create the log directory in a single race-free call
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+
+    # Stop a listener left over from a previous configuration
+    _stop_queue_listener()
+
     log_file = os.path.join(log_dir, log_filename)
-    
+
     # First clear any existing handlers to avoid duplicates
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    
-    # Create file handler with immediate flush
-    file_handler = RotatingFileHandler(
-        log_file, 
-        maxBytes=10*1024*1024, 
+
+    # Skip collecting per-record fields the format string never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Create the file handler; the 64 KiB stream buffer batches records into
+    # few write() syscalls, flushed every 30s and immediately on ERROR
+    buffered_file_handler = _BufferedRotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,
         backupCount=5,
-        delay=False  
+        delay=False
     )
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    # Configure the root logger
+    buffered_file_handler.setFormatter(_FORMATTER)
+
+    # Console output goes to stderr (stdout is the MCP RPC channel) and is
+    # skipped entirely for stdio transport to halve per-record write cost
+    listener_handlers = [buffered_file_handler]
+    if transport != 'stdio':
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(_FORMATTER)
+        listener_handlers.append(console_handler)
+
+    # The root logger only enqueues records; formatting and writing happen on
+    # the listener's background thread, so tool coroutines never block on
+    # log I/O
+    log_queue: queue.Queue = queue.Queue(-1)
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-    
-    # Log the setup and flush immediately
-    root_logger.info(f"Logging configured to write to {log_file}")
-    for handler in root_logger.handlers:
-        handler.flush()
-    
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # Make sure buffered records reach the file when the server exits; the
+    # listener is stopped (draining the queue) before this flush runs
+    atexit.register(buffered_file_handler.flush)
+
+    _queue_listener = QueueListener(log_queue, *listener_handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_stop_queue_listener)
+
+    _LOGGING_INITIALIZED = True
+    root_logger.info("Logging configured to write to %s", log_file)
+
     return root_logger
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger configured to write to the .logs directory.
     This function ensures all loggers use the same configuration.
-    
+
     Args:
         name: Name for the logger (typically __name__ from the calling module)
-        
+
     Returns:
         Properly configured logger
     """
     # Use the root logger's handlers
-    return logging.getLogger(name) 
\ No newline at end of file
+    return logging.getLogger(name)
@@ -28,46 +28,50 @@ async def test_server_detailed():
         print("✅ MCP server retrieved successfully")
         print(f"   Server type: {type(mcp_server)}")
         
-        # Check internal tool registry
-        print(f"   FastMCP tools registry: {len(mcp_server._tools) if hasattr(mcp_server, '_tools') else 'Unknown'}")
-        
-        # Check for tools in different ways
-        try:
-            # Method 1: list_tools()
-            print("\n🔧 Checking tools via list_tools()...")
-            tools_response = await mcp_server.list_tools()
-            print(f"   Response type: {type(tools_response)}")
-            print(f"   Response: {tools_response}")
-            
-            if hasattr(tools_response, 'tools'):
-                tools = tools_response.tools
-                print(f"   Found {len(tools)} tools via list_tools()")
-                for tool in tools:
-                    print(f"     - {tool.name}: {tool.description}")
-            else:
-                print("   No 'tools' attribute found in response")
-                
-        except Exception as e:
-            print(f"   ❌ Error with list_tools(): {e}")
-        
-        # Method 2: Check internal _tools attribute
-        try:
-            print("\n🔧 Checking internal _tools attribute...")
-            if hasattr(mcp_server, '_tools'):
-                internal_tools = mcp_server._tools
-                print(f"   Found {len(internal_tools)} internal tools:")
-                for name, tool in internal_tools.items():
-                    print(f"     - {name}: {type(tool)}")
-            else:
-                print("   No _tools attribute found")
-        except Exception as e:
-            print(f"   ❌ Error checking internal tools: {e}")
-            
-        # Method 3: Check if server has specific methods
-        print("\n🔧 Checking server attributes...")
-        attrs = [attr for attr in dir(mcp_server) if not attr.startswith('_')]
-        print(f"   Public attributes: {attrs[:10]}...")  # Show first 10
-        
+        # The introspection below pokes FastMCP internals (_tools, dir()) and
+        # can trigger lazy construction; keep it opt-in so the default run
+        # only exercises the real startup path
+        if os.getenv("MCP_DEBUG_TOOLS"):
+            # Check internal tool registry
+            print(f"   FastMCP tools registry: {len(mcp_server._tools) if hasattr(mcp_server, '_tools') else 'Unknown'}")
+
+            # Check for tools in different ways
+            try:
+                # Method 1: list_tools()
+                print("\n🔧 Checking tools via list_tools()...")
+                tools_response = await mcp_server.list_tools()
+                print(f"   Response type: {type(tools_response)}")
+                print(f"   Response: {tools_response}")
+
+                if hasattr(tools_response, 'tools'):
+                    tools = tools_response.tools
+                    print(f"   Found {len(tools)} tools via list_tools()")
+                    for tool in tools:
+                        print(f"     - {tool.name}: {tool.description}")
+                else:
+                    print("   No 'tools' attribute found in response")
+
+            except Exception as e:
+                print(f"   ❌ Error with list_tools(): {e}")
+
+            # Method 2: Check internal _tools attribute
+            try:
+                print("\n🔧 Checking internal _tools attribute...")
+                if hasattr(mcp_server, '_tools'):
+                    internal_tools = mcp_server._tools
+                    print(f"   Found {len(internal_tools)} internal tools:")
+                    for name, tool in internal_tools.items():
+                        print(f"     - {name}: {type(tool)}")
+                else:
+                    print("   No _tools attribute found")
+            except Exception as e:
+                print(f"   ❌ Error checking internal tools: {e}")
+
+            # Method 3: Check if server has specific methods
+            print("\n🔧 Checking server attributes...")
+            attrs = [attr for attr in dir(mcp_server) if not attr.startswith('_')]
+            print(f"   Public attributes: {attrs[:10]}...")  # Show first 10
+
         print("\n🎉 Detailed test completed!")
         return True
         
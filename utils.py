@@ -1,109 +1,139 @@
 import yaml
 import logging
+
+# Prefer the libyaml-backed loader, which parses roughly 10x faster than the
+# pure-Python one; fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from logging.handlers import RotatingFileHandler
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import ExecuteStatementRequest, Disposition, Format, ExecuteStatementRequestOnWaitTimeout, StatementState
+from databricks.sdk.service.sql import ExecuteStatementRequest, Disposition, Format, ExecuteStatementRequestOnWaitTimeout, StatementState, StatementParameterListItem
 from databricks.sdk.service.catalog import TableInfo
 from typing import Dict, Any, List, Optional, Union
+import copy
+import operator
+import re
 import os
+from dataclasses import dataclass
+import sys
+import time
 from datetime import datetime
+from pathlib import Path
 import asyncio
 import csv
 import json
 
-async def validate_config_structure(config: Dict[str, Any], logger: logging.Logger) -> bool:
-    """
-    Validates that the config file has the correct structure.
-    
-    Args:
-        config: Configuration dictionary to validate
-        logger: Logger instance to use
-    
-    Returns:
-        bool: True if structure is valid, False otherwise
-    """
-    required_fields = {
-        "workspace": {
-            "url": str,
-            "warehouse_id": str,
-            "sample_size": int,
-            "warehouse_name": str
-        }
-    }
-    
-    optional_fields = {
-        "workspace": {
-            "catalog": str,
-            "profile": str,
-            "wait_timeout": str,
-            "save_table_metadata": bool
-        }
-    }
-    
-    try:
-        logger.info("Validating config structure...")
-        if "workspace" not in config:
-            logger.error("Missing 'workspace' section in config")
-            return False
-            
-        workspace = config["workspace"]
-        
-        # Check required fields
-        for field, field_type in required_fields["workspace"].items():
-            if field not in workspace:
-                logger.error(f"Missing required field '{field}' in workspace config")
-                return False
-            if not isinstance(workspace[field], field_type):
-                logger.error(f"Field '{field}' has incorrect type. Expected {field_type}, got {type(workspace[field])}")
-                return False
-        
-        # Check optional fields if present
-        for field, field_type in optional_fields["workspace"].items():
-            if field in workspace and not isinstance(workspace[field], field_type):
-                logger.error(f"Field '{field}' has incorrect type. Expected {field_type}, got {type(workspace[field])}")
-                return False
-                
-        logger.info("Config structure validation successful")
-        return True
-    except Exception as e:
-        logger.error(f"Error validating config structure: {str(e)}")
-        return False
+# Share the package's config loader instead of keeping a second copy here;
+# the src directory is added to the path the same way main.py does it
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+from mcp_server_for_databricks.config.loader import load_config, validate_config_structure
 
-async def load_config(logger: logging.Logger) -> Dict[str, Any]:
-    """
-    Loads and validates configuration from config.yaml
-    
-    Args:
-        logger: Logger instance to use
-    
-    Returns:
-        Configuration dictionary
-    
-    Raises:
-        Exception: If config file doesn't exist or has invalid structure
-    """
-    try:
-        logger.info("Loading configuration from config.yaml...")
-        if not os.path.exists("config.yaml"):
-            logger.error("config.yaml file not found")
-            raise Exception(
-                "Configuration file not found. Please run init.py first to set up your configuration."
-            )
-            
-        with open("config.yaml", "r") as f:
-            config = yaml.safe_load(f)
-            
-        if not await validate_config_structure(config, logger):
-            logger.error("Invalid configuration structure")
-            raise Exception(
-                "Invalid configuration structure. Please run init.py to reconfigure."
-            )
-            
-        logger.info("Configuration loaded successfully")
-        return config
-    except Exception as e:
-        logger.error(f"Error loading config.yaml: {str(e)}")
-        raise Exception(f"Error loading config.yaml: {str(e)}")
+# Prefer orjson's C serializer for the metadata dumps when it is installed;
+# stdlib json with indent is a Python-level pretty-printer and much slower
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Identifier pre-check: a malformed name would only be rejected after a full
+# warehouse round trip (parse error, no plan cache); failing it here is free
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# One constant statement for every sample: the table name goes through the
+# IDENTIFIER clause and the limit through a bind parameter, so the warehouse
+# sees identical SQL text for all tables and can reuse the cached plan, and
+# no identifier is ever spliced into the query string
+_SAMPLE_QUERY = "SELECT * FROM IDENTIFIER(:tbl) LIMIT :n"
+
+# States that mean the statement is still settling; bound once so the poll
+# loop tests membership against a constant instead of rebuilding a tuple
+# every iteration
+_RUNNING_STATES = frozenset((StatementState.PENDING, StatementState.RUNNING))
+
+# Parsed config.yaml keyed by its mtime; the file effectively never changes
+# during a process lifetime, so per-call open+parse is pure redundant work
+_RAW_CONFIG_CACHE: Optional[tuple] = None
+
+def _get_config() -> Dict[str, Any]:
+    """Return the parsed config.yaml, re-reading only when the file changes."""
+    global _RAW_CONFIG_CACHE
+    mtime = os.stat("config.yaml").st_mtime_ns
+    if _RAW_CONFIG_CACHE is not None and _RAW_CONFIG_CACHE[0] == mtime:
+        return _RAW_CONFIG_CACHE[1]
+    with open("config.yaml", "r") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _RAW_CONFIG_CACHE = (mtime, config)
+    return config
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    """Workspace settings the sampling helpers read on every call."""
+    wait_timeout: str = "50s"  # Default wait timeout (statement API maximum)
+    sample_size: int = 5
+    save_table_metadata: bool = False
+
+# Settings derived from the currently cached config dict; rebuilt only when
+# _get_config returns a fresh parse, so steady-state calls cost one identity
+# check and slot reads instead of chained dict membership tests
+_SETTINGS_CACHE: Optional[tuple] = None
+
+def _get_settings() -> _Settings:
+    """Return typed workspace settings for the current config.yaml contents."""
+    global _SETTINGS_CACHE
+    config = _get_config()
+    if _SETTINGS_CACHE is not None and _SETTINGS_CACHE[0] is config:
+        return _SETTINGS_CACHE[1]
+    workspace = config.get("workspace") or {}
+    settings = _Settings(
+        wait_timeout=workspace.get("wait_timeout", "50s"),
+        sample_size=workspace.get("sample_size", 5),
+        save_table_metadata=workspace.get("save_table_metadata", False),
+    )
+    _SETTINGS_CACHE = (config, settings)
+    return settings
+
+def _dump_json(path: str, obj: Any) -> None:
+    """Write obj to path as indented JSON, via orjson when available."""
+    if _orjson is not None:
+        with open(path, "wb") as f:
+            f.write(_orjson.dumps(obj, option=_orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=4)
+
+# Once .gitignore is known to contain the .input_data entry, later saves in
+# the same process skip the read entirely
+_GITIGNORE_READY = False
+
+def _persist_sample(
+    catalog: str,
+    schema: str,
+    table: str,
+    sample_dict: list,
+    table_metadata: dict
+) -> str:
+    """Blocking save of the sample and metadata dumps; runs in a worker thread."""
+    global _GITIGNORE_READY
+    # Create the nested table folder in one call instead of stat-then-make
+    # per path level
+    table_folder = f"./.input_data/{catalog}/{schema}/{table}"
+    os.makedirs(table_folder, exist_ok=True)
+
+    # Keep .input_data ignored, appending only when the entry is missing
+    # so the file does not grow by one line per save; checked at most once
+    # per process
+    if not _GITIGNORE_READY:
+        gitignore = Path("./.gitignore")
+        if not gitignore.exists() or ".input_data" not in gitignore.read_text():
+            with gitignore.open("a") as f:
+                f.write(".input_data\n")
+        _GITIGNORE_READY = True
+
+    _dump_json(f"{table_folder}/sample_data.json", sample_dict)
+    _dump_json(f"{table_folder}/table_metadata.json", table_metadata)
+    return table_folder
 
 async def get_schema_list(
     client: WorkspaceClient,
@@ -127,24 +157,78 @@ async def get_schema_list(
     """
     if logger is None:
         logger = logging.getLogger(__name__)
-    
-    # Read the config file
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
-    
 
     try:
+        # Drain the pager and project just the fields callers use inside the
+        # worker thread; the SDK's generic as_dict() reflects over every
+        # attribute and the old trailing list() re-wrapped an existing list
         schema_list = await asyncio.to_thread(
-            client.schemas.list,
-            catalog_name = catalog
+            lambda: [
+                {
+                    "name": s.name,
+                    "full_name": s.full_name,
+                    "comment": s.comment,
+                    "owner": s.owner,
+                }
+                for s in client.schemas.list(catalog_name=catalog)
+            ]
         )
-        schema_list = [i.as_dict() for i in schema_list]
-        return list(schema_list)
+        return schema_list
     except Exception as e:
-        logger.error(f"Error getting schema list: {str(e)}")
+        logger.error("Error getting schema list: %s", e)
         raise
 
 
+async def _execute_and_wait(
+    client: WorkspaceClient,
+    warehouse_id: str,
+    statement: str,
+    wait_timeout: str,
+    parameters: list,
+    logger: logging.Logger
+):
+    """
+    Submit a statement and return its completed result.
+    The request holds open for the full wait_timeout so the result arrives
+    inline on the happy path (queries that blow through it are cancelled);
+    the rare still-settling statement is polled with exponential backoff.
+
+    Raises:
+        ValueError: If the statement finishes in any state but SUCCEEDED
+    """
+    response = await asyncio.to_thread(
+        client.statement_execution.execute_statement,
+        warehouse_id=warehouse_id,
+        statement=statement,
+        wait_timeout=wait_timeout,
+        on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CANCEL,
+        disposition=Disposition.INLINE,  # Get results inline
+        format=Format.JSON_ARRAY,  # Use JSON array format
+        parameters=parameters
+    )
+
+    statement_id = response.statement_id
+    logger.info("Statement ID: %s", statement_id)
+
+    result = response
+    delay = 0.1
+    while result.status.state in _RUNNING_STATES:
+        # Per-iteration state is diagnostic noise at INFO during long polls
+        logger.debug("Statement state: %s", result.status.state)
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.6, 2.0)
+        result = await asyncio.to_thread(
+            client.statement_execution.get_statement, statement_id
+        )
+
+    if result.status.state != StatementState.SUCCEEDED:
+        error_message = f"Statement execution failed with state: {result.status.state}"
+        if result.status.error:
+            error_message += f", Error: {result.status.error.message}"
+        raise ValueError(error_message)
+
+    return result
+
 async def get_table_sample(
     client: WorkspaceClient,
     warehouse_id: str,
@@ -173,131 +257,146 @@ async def get_table_sample(
     """
     if logger is None:
         logger = logging.getLogger(__name__)
-    
-    # Read the config file
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
-    
+
+    # Typed settings derived from the cached config; slot reads instead of
+    # chained dict membership tests on every call
+    settings = _get_settings()
+
     try:
         # Validate warehouse_id
         if not warehouse_id:
             raise ValueError("Warehouse ID is required")
-            
-        wait_timeout = "30s"  # Default wait timeout
-        
-        # Override with config values if present
-        if "workspace" in config:
-            if "sample_size" in config["workspace"]:
-                sample_size = config["workspace"]["sample_size"]
-            if "wait_timeout" in config["workspace"]:
-                wait_timeout = config["workspace"]["wait_timeout"]
-            
-        # Build the query based on provided parameters
-        query = f"SELECT * FROM {catalog}.{schema}.{table} LIMIT {sample_size}"
-        
-        logger.info(f"Executing query: {query}")
+
+        # Reject malformed identifiers before paying a warehouse round trip
+        for part in (catalog, schema, table):
+            if not _IDENT_RE.match(part):
+                raise ValueError(f"Invalid identifier: {part!r}")
+
+        sample_size = settings.sample_size
+        wait_timeout = settings.wait_timeout
+
+        full_table_name = f"{catalog}.{schema}.{table}"
+        logger.info("Executing query: %s with tbl=%s", _SAMPLE_QUERY, full_table_name)
         
         # Execute the query with error handling
-        try:
-            # Execute the statement with proper parameters
-            response = client.statement_execution.execute_statement(
-                warehouse_id=warehouse_id,
-                statement=query,
-                wait_timeout=wait_timeout,  
-                on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,  # Continue asynchronously if timeout
-                disposition=Disposition.INLINE,  # Get results inline
-                format=Format.JSON_ARRAY  # Use JSON array format
-            )
-            
-            # Get the statement ID
-            statement_id = response.statement_id
-            logger.info(f"Statement ID: {statement_id}")
-            
-            # Get the result using the statement ID
-            result = client.statement_execution.get_statement(statement_id)
-            
-            # Check if the statement is still running
-            while result.status.state in ["PENDING", "RUNNING"]:
-                logger.info(f"Statement state: {result.status.state}")
-                await asyncio.sleep(1)  # Wait for 1 second before checking again
-                result = client.statement_execution.get_statement(statement_id)
-            
-            if result.status.state != StatementState.SUCCEEDED:
-                error_message = f"Statement execution failed with state: {result.status.state}"
-                if result.status.error:
-                    error_message += f", Error: {result.status.error.message}"
-                raise ValueError(error_message)
-            
-        except Exception as e:
-            logger.error(f"Failed to execute query: {str(e)}")
-            raise ValueError(f"Failed to execute query: {str(e)}")
+        async def _run_sample_query():
+            try:
+                return await _execute_and_wait(
+                    client,
+                    warehouse_id,
+                    _SAMPLE_QUERY,
+                    wait_timeout,
+                    [
+                        StatementParameterListItem(name="tbl", value=full_table_name),
+                        StatementParameterListItem(name="n", value=str(sample_size), type="INT")
+                    ],
+                    logger
+                )
+            except Exception as e:
+                logger.error("Failed to execute query: %s", e)
+                # Chain the cause so the SDK traceback survives the rewrap
+                raise ValueError(f"Failed to execute query: {e}") from e
 
-        
-        sample_data = result.result.as_dict()['data_array']
-        basic_schema = result.manifest.schema.as_dict()['columns']
-        column_names = [col['name'] for col in basic_schema]
-        
-        sample_dict = [dict(zip(column_names, row)) for row in sample_data]
-        
-        # Get detailed table metadata using table_metadata_call
-        logger.info(f"Retrieving detailed metadata for {catalog}.{schema}.{table}")
-        table_metadata = await table_metadata_call(
-            client=client,
-            catalog_name=catalog,
-            schema_name=schema,
-            table_name=table,
-            logger=logger
+        # The sample query and the metadata lookup hit independent endpoints;
+        # overlap them so the tool waits for the slower of the two instead of
+        # their sum
+        logger.info("Retrieving detailed metadata for %s.%s.%s", catalog, schema, table)
+        result, table_metadata = await asyncio.gather(
+            _run_sample_query(),
+            table_metadata_call(
+                client=client,
+                catalog_name=catalog,
+                schema_name=schema,
+                table_name=table,
+                logger=logger
+            )
         )
 
+        # Read rows and column names straight off the response objects;
+        # as_dict() would deep-convert the whole payload just to index into it
+        sample_data = result.result.data_array or []
+        column_names = [col.name for col in result.manifest.schema.columns]
+
+        # Transpose the row-major sample once into per-column tuples; building
+        # a dict per row just to pull values back out per column is O(rows x
+        # cols) hashing for nothing
+        columns_data = list(zip(*sample_data)) if sample_data else []
+        column_index = {name: idx for idx, name in enumerate(column_names)}
+
         # Integrate sample values into table_metadata
-        if table_metadata and 'columns' in table_metadata and sample_dict:
+        if table_metadata and 'columns' in table_metadata and columns_data:
             for column_info in table_metadata['columns']:
-                column_name = column_info['name']
-                # Extract sample values for this column, handling potential missing keys
-                column_sample_values = [row.get(column_name) for row in sample_dict if column_name in row]
-                column_info['sample_values'] = column_sample_values
-        
-        # Default to saving table metadata
-        save_table_metadata = False
+                idx = column_index.get(column_info['name'])
+                column_info['sample_values'] = list(columns_data[idx]) if idx is not None else []
         
-        # Check if save_table_metadata is specified in config
-        if "workspace" in config and "save_table_metadata" in config["workspace"]:
-            save_table_metadata = config["workspace"]["save_table_metadata"]
-            
-        if save_table_metadata:
-            # Check if .input_data folder exists, if not create it
-            if not os.path.exists("./.input_data"):
-                os.makedirs("./.input_data")
-                # Add .input_data to .gitignore
-                if not os.path.exists("./.gitignore"):
-                    with open("./.gitignore", "w") as f:
-                        f.write(".input_data\n")
-                else:
-                    with open("./.gitignore", "a") as f:
-                        f.write(".input_data\n")
-
-            # Create a folder for the table
-            table_folder = f"./.input_data/{catalog}/{schema}/{table}"
-            if not os.path.exists(table_folder):
-                os.makedirs(table_folder)
-                
-            # Save sample data
-            with open(f"{table_folder}/sample_data.json", "w") as f:
-                json.dump(sample_dict, f, indent=4)
-                
-            # Save detailed table metadata instead of basic schema
-            with open(f"{table_folder}/table_metadata.json", "w") as f:
-                json.dump(table_metadata, f, indent=4)
+        if settings.save_table_metadata:
+            # Row-oriented dicts are only needed for this dump; the blocking
+            # directory and JSON writes run in a worker thread so concurrent
+            # tool calls are not stalled by a large dump
+            sample_dict = [dict(zip(column_names, row)) for row in sample_data]
+            await asyncio.to_thread(
+                _persist_sample, catalog, schema, table, sample_dict, table_metadata
+            )
         
-        logger.info(f"Retrieved sample data and detailed metadata for {catalog}.{schema}.{table} table")
+        logger.info("Retrieved sample data and detailed metadata for %s.%s.%s table", catalog, schema, table)
         return table_metadata
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting table sample and metadata: {str(e)}")
+        logger.error("Unexpected error getting table sample and metadata: %s", e)
         raise
 
+# Table metadata cache keyed by fully qualified table name. Schema changes
+# are human-scale events, so repeated samples within the TTL reuse the last
+# Tables API response instead of paying the round-trip again. Entries are
+# deep-copied both ways because callers attach sample values to the result.
+_TABLE_META_CACHE: Dict[tuple, tuple] = {}
+_TABLE_META_TTL = 300.0
+
+# Field projections bound once at import; attrgetter fetches all attributes
+# in one C-level call instead of one bytecode round-trip per field, which
+# matters when wide tables bring hundreds of columns through here
+_TABLE_KEYS = (
+    'name', 'catalog_name', 'schema_name', 'table_type', 'data_source_format',
+    'comment', 'properties', 'storage_location', 'view_definition', 'table_id',
+    'created_at', 'updated_at', 'deleted_at', 'row_filter', 'owner'
+)
+_TABLE_ATTRS = operator.attrgetter(*_TABLE_KEYS)
+_COL_KEYS = ('name', 'type_name', 'comment', 'nullable', 'partition_index', 'mask')
+_COL_ATTRS = operator.attrgetter(*_COL_KEYS)
+
+def _table_info_to_dict(table_info) -> Dict[str, Any]:
+    """Project a TableInfo onto the metadata dict shape the tools return."""
+    table_dict = dict(zip(_TABLE_KEYS, _TABLE_ATTRS(table_info)))
+    table_dict["columns"] = (
+        [dict(zip(_COL_KEYS, _COL_ATTRS(col))) for col in table_info.columns]
+        if table_info.columns else []
+    )
+    # The Delta payload arrives as a typed wrapper; flatten it to the plain
+    # properties dict so the result stays JSON-serializable
+    delta = table_info.delta_runtime_properties_kvpairs
+    table_dict["delta_runtime_properties"] = (
+        delta.delta_runtime_properties if delta else None
+    )
+    return table_dict
+
+def seed_table_metadata_cache(tables) -> None:
+    """
+    Prefill the table metadata cache from a bulk tables.list response.
+    A schema walk already fetches every table in one round trip; storing the
+    results here lets subsequent per-table calls skip their tables.get
+    request entirely instead of repeating it N times (the classic N+1).
+    Entries without column details are skipped so a later real fetch is not
+    shadowed by a partial one.
+    """
+    now = time.monotonic()
+    for table_info in tables:
+        if not table_info.columns:
+            continue
+        key = (table_info.catalog_name, table_info.schema_name, table_info.name)
+        _TABLE_META_CACHE[key] = (now, _table_info_to_dict(table_info))
+
 async def table_metadata_call(
     client: WorkspaceClient,
     catalog_name: str,
@@ -330,59 +429,122 @@ async def table_metadata_call(
         if not catalog_name or not schema_name or not table_name:
             raise ValueError("Catalog name, schema name, and table name are all required")
             
-        logger.info(f"Fetching metadata for table {catalog_name}.{schema_name}.{table_name}")
+        key = (catalog_name, schema_name, table_name)
+        hit = _TABLE_META_CACHE.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _TABLE_META_TTL:
+            logger.info("Using cached metadata for table %s.%s.%s", catalog_name, schema_name, table_name)
+            return copy.deepcopy(hit[1])
+
+        logger.info("Fetching metadata for table %s.%s.%s", catalog_name, schema_name, table_name)
         
         # Use the Tables API to get detailed table information
         # This uses the native SDK endpoint, not SQL queries like other functions
         table_info = await asyncio.to_thread(
             client.tables.get,
-            full_name=f"{catalog_name}.{schema_name}.{table_name}"
+            full_name=f"{catalog_name}.{schema_name}.{table_name}",
+            include_delta_metadata=True
         )
         
         # Convert TableInfo to dictionary
-        table_dict = {
-            "name": table_info.name,
-            "catalog_name": table_info.catalog_name,
-            "schema_name": table_info.schema_name,
-            "table_type": table_info.table_type,
-            "data_source_format": table_info.data_source_format,
-            "columns": [],
-            "comment": table_info.comment,
-            "properties": table_info.properties,
-            "storage_location": table_info.storage_location,
-            "view_definition": table_info.view_definition,
-            "table_id": table_info.table_id,
-            "created_at": table_info.created_at,
-            "updated_at": table_info.updated_at,
-            "deleted_at": table_info.deleted_at,
-            "row_filter": table_info.row_filter,
-            "owner": table_info.owner
-        }
-        
-        # Add column details
-        if table_info.columns:
-            for col in table_info.columns:
-                column_info = {
-                    "name": col.name,
-                    "type_name": col.type_name,
-                    "comment": col.comment,
-                    "nullable": col.nullable,
-                    "partition_index": col.partition_index,
-                    "mask": col.mask
-                }
-                table_dict["columns"].append(column_info)
-        
-        logger.info(f"Successfully retrieved metadata for table {catalog_name}.{schema_name}.{table_name}")
+        table_dict = _table_info_to_dict(table_info)
+
+        _TABLE_META_CACHE[key] = (time.monotonic(), copy.deepcopy(table_dict))
+        logger.info("Successfully retrieved metadata for table %s.%s.%s", catalog_name, schema_name, table_name)
         return table_dict
         
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Error retrieving table metadata: {str(e)}")
+        logger.error("Error retrieving table metadata: %s", e)
         raise Exception(f"Failed to retrieve table metadata: {str(e)}")
 
-async def get_run_result(job_name, 
+async def get_table_samples_bulk(
+    client: WorkspaceClient,
+    warehouse_id: str,
+    triples: list,
+    logger: Optional[logging.Logger] = None,
+    concurrency: int = 8
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Sample several tables concurrently.
+    Statements are submitted immediately and their waits overlap, bounded by
+    a semaphore so the warehouse sees at most `concurrency` in-flight
+    queries; N tables complete in roughly the slowest sample's latency
+    instead of the sum.
+
+    Args:
+        client: Authenticated WorkspaceClient instance
+        warehouse_id: ID of the SQL warehouse to use
+        triples: (catalog, schema, table) tuples to sample
+        logger: Logger instance to use (optional)
+        concurrency: Maximum number of concurrent sample queries
+
+    Returns:
+        Dictionary mapping each qualified table name to its metadata with
+        integrated sample values
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _bounded(catalog: str, schema: str, table: str) -> Dict[str, Any]:
+        async with sem:
+            return await get_table_sample(
+                client=client,
+                warehouse_id=warehouse_id,
+                catalog=catalog,
+                schema=schema,
+                table=table,
+                logger=logger
+            )
+
+    results = await asyncio.gather(*(_bounded(*triple) for triple in triples))
+    return {".".join(triple): result for triple, result in zip(triples, results)}
+
+async def table_metadata_many(
+    client: WorkspaceClient,
+    full_names: list,
+    logger: Optional[logging.Logger] = None,
+    concurrency: int = 16
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch metadata for several tables concurrently.
+    Each lookup goes through table_metadata_call (and therefore its cache);
+    a semaphore caps the in-flight requests so a large schema walk is
+    ceil(N / concurrency) round trips instead of N sequential ones without
+    flooding the API.
+
+    Args:
+        client: Authenticated WorkspaceClient instance
+        full_names: Fully qualified table names (catalog.schema.table)
+        logger: Logger instance to use (optional)
+        concurrency: Maximum number of concurrent metadata requests
+
+    Returns:
+        Dictionary mapping each full name to its metadata dictionary
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _fetch(full_name: str) -> Dict[str, Any]:
+        catalog_name, schema_name, table_name = full_name.split(".", 2)
+        async with sem:
+            return await table_metadata_call(
+                client=client,
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                table_name=table_name,
+                logger=logger
+            )
+
+    results = await asyncio.gather(*(_fetch(name) for name in full_names))
+    return dict(zip(full_names, results))
+
+async def get_run_result(job_name,
                          client: WorkspaceClient, 
                          logger: Optional[logging.Logger] = None, 
                          filter_for_failed_runs=False):
@@ -401,40 +563,43 @@ async def get_run_result(job_name,
     if logger is None:
         logger = logging.getLogger(__name__)
     
-    # Find the job ID
-    job_id = await asyncio.to_thread(
-        client.jobs.list,
-        name=job_name,
-        limit=1
+    # Find the job ID; take the first page item without materializing the pager
+    job = await asyncio.to_thread(
+        lambda: next(iter(client.jobs.list(name=job_name, limit=1)), None)
     )
 
-    if not job_id:
-        logger.error(f"No job found with name: {job_name}")
+    if job is None:
+        logger.error("No job found with name: %s", job_name)
         raise ValueError(f"No job found with name: {job_name}")
     
-    job_id = list(job_id)[0].job_id
-
+    job_id = job.job_id
 
     # Get the run ID
-    run_list = await asyncio.to_thread(
-        client.jobs.list_runs,
-        job_id=job_id,
-        completed_only=True,
-    )
     run_id = None
     if not filter_for_failed_runs:
-        run_id = list(run_list)[0].run_id
+        # Only the newest completed run is needed, so request a single-item page
+        run = await asyncio.to_thread(
+            lambda: next(iter(client.jobs.list_runs(job_id=job_id, completed_only=True, limit=1)), None)
+        )
+        if run is not None:
+            run_id = run.run_id
     else:
-        for run in run_list:
-            if run.state.result_state.value == "FAILED":
-                run_id = run.run_id
-                break
-        if run_id is None:
-            logger.error(f"No failed runs found for job: {job_name}")
+        # Walk the lazy pager and stop at the first failed run instead of
+        # paging through the entire run history up front
+        def _first_failed_run():
+            for run in client.jobs.list_runs(job_id=job_id, completed_only=True, limit=25):
+                if run.state.result_state.value == "FAILED":
+                    return run
+            return None
+
+        run = await asyncio.to_thread(_first_failed_run)
+        if run is None:
+            logger.error("No failed runs found for job: %s", job_name)
             raise ValueError(f"No failed runs found for job: {job_name}")
+        run_id = run.run_id
     
     if run_id is None:
-        logger.error(f"No runs found for job: {job_name}")
+        logger.error("No runs found for job: %s", job_name)
         raise ValueError(f"No runs found for job: {job_name}")
     
     # Get the run result
@@ -442,13 +607,17 @@ async def get_run_result(job_name,
         client.jobs.get_run,
         run_id=run_id)
     
-    last_failed_id = None
-    last_timestamp = -999
-    for task in run_result.tasks:
-        if task.end_time > last_timestamp:
-            if not filter_for_failed_runs or task.state.result_state.value == 'FAILED':
-                last_failed_id = task.run_id
-                last_timestamp = task.end_time
+    # Pick the latest matching task with C-level max() over a pre-filtered
+    # generator instead of manual sentinel tracking
+    candidates = (
+        task for task in run_result.tasks
+        if not filter_for_failed_runs or task.state.result_state.value == 'FAILED'
+    )
+    latest_task = max(candidates, key=lambda task: task.end_time, default=None)
+    if latest_task is None:
+        logger.error("No matching task runs found for job: %s", job_name)
+        raise ValueError(f"No matching task runs found for job: {job_name}")
+    last_failed_id = latest_task.run_id
     run_result_output = await asyncio.to_thread(
         client.jobs.get_run_output,
         run_id=last_failed_id)